@@ -3,16 +3,31 @@
 from __future__ import annotations
 
 import argparse
-from typing import Iterable, List
+from typing import Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
 
 
 def parse_int_sequence(values: Iterable[str], value_name: str) -> List[int]:
     """Parse integers from CLI arguments, accepting decimal or hexadecimal input."""
 
-    parsed: List[int] = []
-    for raw in values:
-        try:
-            parsed.append(int(raw, 0))
-        except ValueError as exc:
-            raise argparse.ArgumentTypeError(f"Invalid {value_name}: {raw}") from exc
-    return parsed
+    values = list(values)
+    try:
+        return [int(raw, 0) for raw in values]
+    except ValueError:
+        # Only re-scan on failure so the error names the offending value.
+        for raw in values:
+            try:
+                int(raw, 0)
+            except ValueError as exc:
+                raise argparse.ArgumentTypeError(f"Invalid {value_name}: {raw}") from exc
+        raise
+
+
+def first_not_none(*values: Optional[T]) -> Optional[T]:
+    """Return the first value that is not ``None`` (CLI flag, then setting, then default)."""
+
+    for value in values:
+        if value is not None:
+            return value
+    return None
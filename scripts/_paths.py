@@ -5,12 +5,18 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+_SRC_ADDED = False
+
 
 def add_project_src_to_path() -> None:
     """Prepend the repository's src directory to sys.path if needed."""
 
-    root = Path(__file__).resolve().parents[1]
-    src = root / "src"
+    global _SRC_ADDED
+    if _SRC_ADDED:
+        return
+    # absolute() avoids the symlink walk done by resolve(); __file__ is already absolute in practice.
+    src = Path(__file__).absolute().parent.parent / "src"
     src_str = str(src)
     if src.exists() and src_str not in sys.path:
         sys.path.insert(0, src_str)
+    _SRC_ADDED = True
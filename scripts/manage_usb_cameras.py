@@ -22,13 +22,16 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-from pathlib import Path
 from typing import List, Optional
 
 from _paths import add_project_src_to_path
 
 add_project_src_to_path()
 
+UVC_DRIVER_PATH = "/sys/bus/usb/drivers/uvcvideo"
+USB_DEVICES_PATH = "/sys/bus/usb/devices"
+_DRIVER_CONTROL_FILES = frozenset({"bind", "module", "new_id", "remove_id", "uevent"})
+
 
 def require_root() -> None:
     if os.geteuid() != 0:
@@ -37,33 +40,44 @@ def require_root() -> None:
 
 
 def find_usb_camera_devices() -> List[str]:
-    base = Path("/sys/bus/usb/drivers/uvcvideo")
-    if not base.exists():
+    try:
+        with os.scandir(UVC_DRIVER_PATH) as entries:
+            devices = {
+                entry.name.split(":", 1)[0]
+                for entry in entries
+                if ":" in entry.name and entry.name not in _DRIVER_CONTROL_FILES
+            }
+    except FileNotFoundError:
         return []
-    devices: set[str] = set()
-    for entry in base.iterdir():
-        if entry.name in {"bind", "module", "new_id", "remove_id", "uevent"}:
-            continue
-        if ":" not in entry.name:
-            continue
-        devices.add(entry.name.split(":")[0])
     return sorted(devices)
 
 
+def _authorized_path(device_id: str) -> str:
+    return f"{USB_DEVICES_PATH}/{device_id}/authorized"
+
+
 def read_authorized(device_id: str) -> Optional[bool]:
-    target = Path("/sys/bus/usb/devices") / device_id / "authorized"
     try:
-        value = target.read_text().strip()
+        fd = os.open(_authorized_path(device_id), os.O_RDONLY)
     except FileNotFoundError:
         return None
-    return value == "1"
+    try:
+        value = os.read(fd, 4).strip()
+    finally:
+        os.close(fd)
+    return value == b"1"
 
 
 def set_authorized(device_id: str, enabled: bool) -> None:
-    target = Path("/sys/bus/usb/devices") / device_id / "authorized"
-    if not target.exists():
-        raise FileNotFoundError(f"Authorized file not found for device {device_id} (path {target})")
-    target.write_text("1\n" if enabled else "0\n")
+    target = _authorized_path(device_id)
+    try:
+        fd = os.open(target, os.O_WRONLY)
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Authorized file not found for device {device_id} (path {target})") from exc
+    try:
+        os.write(fd, b"1\n" if enabled else b"0\n")
+    finally:
+        os.close(fd)
 
 
 def usb_status() -> int:
@@ -71,16 +85,16 @@ def usb_status() -> int:
     if not devices:
         print("No USB UVC cameras detected.")
         return 0
-    print("USB UVC camera devices:")
+    lines = ["USB UVC camera devices:"]
     for device in devices:
         state = read_authorized(device)
         label = "enabled" if state else "disabled" if state is not None else "unknown (missing authorized state)"
-        print(f"  - {device}: {label}")
+        lines.append(f"  - {device}: {label}")
+    sys.stdout.write("\n".join(lines) + "\n")
     return 0
 
 
 def usb_toggle(enable: bool) -> int:
-    require_root()
     devices = find_usb_camera_devices()
     if not devices:
         print("No USB UVC cameras detected.")
@@ -120,6 +134,9 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if args.enable or args.disable:
+        # Checked here, once per run, before any sysfs access.
+        require_root()
     if args.enable:
         return usb_toggle(True)
     if args.disable:
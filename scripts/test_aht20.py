@@ -6,12 +6,11 @@ from __future__ import annotations
 import argparse
 import sys
 import time
-from _paths import add_project_src_to_path
 
-add_project_src_to_path()
-
-from featherflap.config import DEFAULT_AHT20_I2C_ADDRESS, get_settings
-from featherflap.hardware.i2c import SMBusNotAvailable, has_smbus, open_bus
+# Readiness checks (seconds after the trigger) clustered around the ~80 ms typical / 100 ms max conversion time.
+AHT20_POLL_SCHEDULE_SECONDS = (0.075, 0.085, 0.092, 0.097, 0.100)
+AHT20_HUMIDITY_SCALE = 100.0 / 1048576.0
+AHT20_TEMPERATURE_SCALE = 200.0 / 1048576.0
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,13 +33,13 @@ def parse_args() -> argparse.Namespace:
         "--retry",
         type=int,
         default=5,
-        help="Number of retries while waiting for the sensor to become ready (default: 5).",
+        help="Extra readiness checks after the nominal 100 ms conversion window (default: 5).",
     )
     parser.add_argument(
         "--delay",
         type=float,
         default=0.02,
-        help="Delay in seconds between readiness checks (default: 0.02).",
+        help="Delay in seconds between the extra readiness checks (default: 0.02).",
     )
     parser.add_argument(
         "--no-reset",
@@ -60,32 +59,56 @@ def probe_aht20(bus, address: int) -> int:
     return status
 
 
-def read_aht20(bus, address: int, retries: int, delay: float, perform_reset: bool) -> tuple[float, float]:
+def decode_aht20(data) -> tuple[float, float]:
+    """Decode a 6-byte AHT20 response into (temperature °C, humidity %)."""
+
+    # status(8) | humidity(20) | temperature(20) packed big-endian.
+    word = int.from_bytes(bytes(data[:6]), "big")
+    humidity = ((word >> 20) & 0xFFFFF) * AHT20_HUMIDITY_SCALE
+    temperature = (word & 0xFFFFF) * AHT20_TEMPERATURE_SCALE - 50.0
+    return temperature, humidity
+
+
+def read_aht20(
+    bus,
+    address: int,
+    retries: int,
+    delay: float,
+    perform_reset: bool,
+    needs_init: bool = True,
+) -> tuple[float, float]:
     if perform_reset:
         bus.write_byte(address, 0xBA)  # soft reset
         time.sleep(0.02)
-    bus.write_i2c_block_data(address, 0xBE, [0x08, 0x00])  # init
-    time.sleep(0.01)
+    # The reset/init/trigger commands each need settle time, so they cannot share one I2C_RDWR
+    # transaction; instead skip the init transfer when the status probe already reports calibration.
+    if perform_reset or needs_init:
+        bus.write_i2c_block_data(address, 0xBE, [0x08, 0x00])  # init
+        time.sleep(0.01)
     bus.write_i2c_block_data(address, 0xAC, [0x33, 0x00])
-    time.sleep(0.08)
 
-    for attempt in range(max(retries, 1)):
+    # Poll at fixed offsets from the trigger, then fall back to --retry checks spaced --delay apart.
+    start = time.monotonic()
+    last = AHT20_POLL_SCHEDULE_SECONDS[-1]
+    offsets = AHT20_POLL_SCHEDULE_SECONDS + tuple(last + delay * (n + 1) for n in range(max(retries, 0)))
+    for offset in offsets:
+        remaining = start + offset - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
         data = bus.read_i2c_block_data(address, 0x00, 6)
-        if data[0] & 0x80:  # busy bit
-            time.sleep(delay)
-            continue
-        raw_h = ((data[1] << 12) | (data[2] << 4) | (data[3] >> 4)) & 0xFFFFF
-        raw_t = (((data[3] & 0x0F) << 16) | (data[4] << 8) | data[5]) & 0xFFFFF
-        humidity = raw_h / 1048576.0 * 100.0
-        temperature = raw_t / 1048576.0 * 200.0 - 50.0
-        return temperature, humidity
-        if attempt == 0:
-            time.sleep(0.05)  # allow extra time after first read
+        if not data[0] & 0x80:  # busy bit
+            return decode_aht20(data)
     raise RuntimeError("AHT20 sensor busy after maximum retries.")
 
 
 def main() -> int:
     args = parse_args()
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import get_settings
+    from featherflap.hardware.i2c import SMBusNotAvailable, has_smbus, open_bus
+
     if not has_smbus():
         print("ERROR: smbus/smbus2 library is not installed.", file=sys.stderr)
         return 2
@@ -103,7 +126,14 @@ def main() -> int:
                 print(f"Sensor status: 0x{status:02X} (busy bit set). Waiting for measurement...", file=sys.stderr)
             if not calibrated:
                 print(f"Sensor status: 0x{status:02X} (calibration bit clear). Initialising...", file=sys.stderr)
-            temperature, humidity = read_aht20(bus, address, args.retry, args.delay, not args.no_reset)
+            temperature, humidity = read_aht20(
+                bus,
+                address,
+                args.retry,
+                args.delay,
+                not args.no_reset,
+                needs_init=not calibrated,
+            )
     except FileNotFoundError as exc:
         print(f"ERROR: I2C bus {bus_id} not found: {exc}", file=sys.stderr)
         return 2
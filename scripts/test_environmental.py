@@ -6,18 +6,6 @@ from __future__ import annotations
 import argparse
 import sys
 
-from _paths import add_project_src_to_path
-
-add_project_src_to_path()
-
-from featherflap.config import (
-    DEFAULT_AHT20_I2C_ADDRESS,
-    DEFAULT_BMP280_I2C_ADDRESS,
-    get_settings,
-)
-from featherflap.hardware.i2c import SMBusNotAvailable
-from featherflap.hardware.sensors import EnvironmentSnapshot, read_environment
-
 
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     parser = argparse.ArgumentParser(
@@ -46,6 +34,13 @@ def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
 
 def main() -> int:
     _parser, args = parse_args()
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import DEFAULT_AHT20_I2C_ADDRESS, DEFAULT_BMP280_I2C_ADDRESS, get_settings
+    from featherflap.hardware.i2c import SMBusNotAvailable
+    from featherflap.hardware.sensors import EnvironmentSnapshot, read_environment
+
     settings = get_settings()
     bus_id = args.bus_id if args.bus_id is not None else settings.i2c_bus_id
     aht20_address = (
@@ -7,13 +7,21 @@ import argparse
 import sys
 import time
 
+PREVIEW_SIZE = (640, 480)
+
 
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     parser = argparse.ArgumentParser(
         description=(
-            "Initialise Picamera2, start a preview capture, and shut it down to verify CSI camera wiring."
+            "Initialise Picamera2 and read the sensor properties to verify CSI camera wiring. "
+            "Use --preview to also start the capture pipeline."
         )
     )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Start a full preview capture instead of only probing the sensor.",
+    )
     parser.add_argument(
         "--preview-seconds",
         type=float,
@@ -40,8 +48,24 @@ def main() -> int:
         print(f"ERROR: Failed to initialise Picamera2: {exc}", file=sys.stderr)
         return 1
 
+    if not args.preview:
+        try:
+            properties = camera.camera_properties
+            modes = camera.sensor_modes
+            print(
+                f"Picamera2 detected {properties.get('Model', 'unknown sensor')} "
+                f"with {len(modes)} sensor mode(s)."
+            )
+        except Exception as exc:
+            print(f"ERROR: Picamera2 probe failed: {exc}", file=sys.stderr)
+            return 1
+        finally:
+            camera.close()
+        return 0
+
     try:
-        camera.configure(camera.create_still_configuration())
+        # A small single-buffer still config is enough to prove the pipeline starts and keeps DMA allocation short.
+        camera.configure(camera.create_still_configuration(main={"size": PREVIEW_SIZE}, buffer_count=1))
         camera.start()
         print(f"Picamera2 started successfully; running preview for {duration} seconds...")
         time.sleep(duration)
@@ -4,16 +4,9 @@
 from __future__ import annotations
 
 import argparse
+import queue
 import sys
 import time
-from typing import Dict
-
-from _paths import add_project_src_to_path
-
-add_project_src_to_path()
-
-from featherflap.config import get_settings
-from _args import parse_int_sequence
 
 
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
@@ -38,17 +31,60 @@ def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
         default=0.5,
         help="Seconds to wait between samples (default: 0.5).",
     )
+    parser.add_argument(
+        "--events",
+        action="store_true",
+        help="Wait for edge interrupts and print each transition until Ctrl+C instead of polling.",
+    )
     return parser, parser.parse_args()
 
 
+def poll_levels(GPIO, pins: list[int], samples: int, interval: float) -> None:
+    """Read every pin ``samples`` times, spacing samples ``interval`` seconds apart."""
+
+    read_pin = GPIO.input
+    # Schedule samples against fixed monotonic ticks so GPIO/print latency does not accumulate.
+    next_tick = time.monotonic()
+    for sample in range(max(1, samples)):
+        levels = [read_pin(pin) for pin in pins]
+        lines = [f"Sample {sample + 1}:"]
+        lines.extend(f"  GPIO{pin}: {'HIGH' if value else 'LOW'}" for pin, value in zip(pins, levels))
+        sys.stdout.write("\n".join(lines) + "\n")
+        if sample + 1 < samples:
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+
+def watch_edges(GPIO, pins: list[int]) -> None:
+    """Block on GPIO edge interrupts and print every PIR transition."""
+
+    events: "queue.Queue[int]" = queue.Queue()
+    for pin in pins:
+        GPIO.add_event_detect(pin, GPIO.BOTH, callback=events.put)
+    print(f"Waiting for PIR transitions on GPIO {', '.join(str(pin) for pin in pins)}. Press Ctrl+C to stop.")
+    while True:
+        pin = events.get()
+        level = "HIGH" if GPIO.input(pin) else "LOW"
+        print(f"  GPIO{pin}: {level}")
+
+
 def main() -> int:
+    parser, args = parse_args()
+
     try:
         import RPi.GPIO as GPIO  # type: ignore
     except ImportError as exc:  # pragma: no cover - optional dependency
         print("ERROR: RPi.GPIO is not installed. Install python3-rpi.gpio on Raspberry Pi OS.", file=sys.stderr)
         return 2
 
-    parser, args = parse_args()
+    from _args import parse_int_sequence
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import get_settings
+
     settings = get_settings()
     if args.pins:
         try:
@@ -61,22 +97,19 @@ def main() -> int:
         print("ERROR: No PIR pins configured.", file=sys.stderr)
         return 1
 
+    interval = max(0.0, args.interval)
+
     GPIO.setwarnings(False)
     GPIO.setmode(GPIO.BCM)
-    states: Dict[int, int] = {}
     try:
-        for pin in pins:
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-        for sample in range(max(1, args.samples)):
-            states.clear()
-            for pin in pins:
-                states[pin] = GPIO.input(pin)
-            print(f"Sample {sample + 1}:")
-            for pin in pins:
-                level = "HIGH" if states[pin] else "LOW"
-                print(f"  GPIO{pin}: {level}")
-            if sample + 1 < args.samples:
-                time.sleep(max(0.0, args.interval))
+        # RPi.GPIO accepts a channel list for setup; input() is per-channel only.
+        GPIO.setup(pins, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+        if args.events:
+            watch_edges(GPIO, pins)
+        else:
+            poll_levels(GPIO, pins, args.samples, interval)
+    except KeyboardInterrupt:
+        print("\nStopping PIR watch.")
     except Exception as exc:
         print(f"ERROR: Failed to read PIR sensors: {exc}", file=sys.stderr)
         return 1
@@ -7,13 +7,6 @@ import argparse
 import sys
 import time
 
-from _paths import add_project_src_to_path
-
-add_project_src_to_path()
-
-from featherflap.config import get_settings
-from _args import parse_int_sequence
-
 
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     parser = argparse.ArgumentParser(
@@ -41,13 +34,20 @@ def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
 
 
 def main() -> int:
+    parser, args = parse_args()
+
     try:
         import RPi.GPIO as GPIO  # type: ignore
     except ImportError as exc:  # pragma: no cover - optional dependency
         print("ERROR: RPi.GPIO is not installed. Install python3-rpi.gpio on Raspberry Pi OS.", file=sys.stderr)
         return 2
 
-    parser, args = parse_args()
+    from _args import parse_int_sequence
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import get_settings
+
     settings = get_settings()
     if args.pins:
         try:
@@ -63,18 +63,25 @@ def main() -> int:
     hold = max(0.0, args.hold)
     rounds = max(1, args.rounds)
 
+    # Precompute one output frame per channel so each step is a single GPIO.output(channel_list, states) call.
+    all_low = [GPIO.LOW] * len(pins)
+    frames = []
+    for index, pin in enumerate(pins):
+        states = list(all_low)
+        states[index] = GPIO.HIGH
+        frames.append((f"  Driving GPIO{pin} HIGH", states))
+
     GPIO.setwarnings(False)
     GPIO.setmode(GPIO.BCM)
     try:
-        for pin in pins:
-            GPIO.setup(pin, GPIO.OUT, initial=GPIO.LOW)
+        GPIO.setup(pins, GPIO.OUT, initial=GPIO.LOW)
         for round_index in range(rounds):
             print(f"Round {round_index + 1} of {rounds}")
-            for pin in pins:
-                print(f"  Driving GPIO{pin} HIGH")
-                GPIO.output(pin, GPIO.HIGH)
+            for label, states in frames:
+                print(label)
+                GPIO.output(pins, states)
                 time.sleep(hold)
-                GPIO.output(pin, GPIO.LOW)
+                GPIO.output(pins, all_low)
     except Exception as exc:
         print(f"ERROR: Failed to toggle RGB LED pins: {exc}", file=sys.stderr)
         return 1
@@ -7,15 +7,6 @@ import argparse
 import math
 import os
 import sys
-from _paths import add_project_src_to_path
-
-add_project_src_to_path()
-
-from featherflap.config import DEFAULT_UPTIME_I2C_ADDRESSES, get_settings
-from featherflap.hardware.battery import BatteryEstimator
-from featherflap.hardware.i2c import SMBusNotAvailable
-from featherflap.hardware.power import UPSReadings, read_ups
-from _args import parse_int_sequence
 
 
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
@@ -61,23 +52,48 @@ def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
 class Palette:
     """Lightweight ANSI colour palette."""
 
+    reset = "\033[0m"
+    bold = "\033[1m"
+    cyan = "\033[36m"
+    magenta = "\033[35m"
+    green = "\033[32m"
+    yellow = "\033[33m"
+    red = "\033[31m"
+    blue = "\033[34m"
+    dim = "\033[2m"
+
     def __init__(self, enabled: bool) -> None:
         self.enabled = enabled
-        self.reset = "\033[0m" if enabled else ""
-        self.bold = "\033[1m" if enabled else ""
-        self.cyan = "\033[36m" if enabled else ""
-        self.magenta = "\033[35m" if enabled else ""
-        self.green = "\033[32m" if enabled else ""
-        self.yellow = "\033[33m" if enabled else ""
-        self.red = "\033[31m" if enabled else ""
-        self.blue = "\033[34m" if enabled else ""
-        self.dim = "\033[2m" if enabled else ""
-
-    def wrap(self, text: str, *styles: str) -> str:
-        if not self.enabled or not styles:
+        self.wrap = self._wrap_ansi if enabled else self._wrap_plain
+
+    @staticmethod
+    def _wrap_plain(text: str, *styles: str) -> str:
+        return text
+
+    def _wrap_ansi(self, text: str, *styles: str) -> str:
+        if len(styles) == 1:
+            return styles[0] + text + self.reset
+        if not styles:
             return text
-        prefix = "".join(styles)
-        return f"{prefix}{text}{self.reset}"
+        return f"{''.join(styles)}{text}{self.reset}"
+
+
+FLOW_LABELS = {
+    "discharging": "Supplying load",
+    "charging": "Charging battery",
+    "idle": "Near zero",
+    "unknown": "Current unavailable",
+}
+FLOW_COLOURS = {
+    "discharging": Palette.green,
+    "charging": Palette.yellow,
+    "idle": Palette.cyan,
+    "unknown": Palette.dim,
+}
+FLOW_DIRECTIONS = {
+    "discharging": "to load",
+    "charging": "into battery",
+}
 
 
 def _supports_color(args: argparse.Namespace) -> bool:
@@ -89,29 +105,35 @@ def _supports_color(args: argparse.Namespace) -> bool:
 
 
 def format_duration(hours: float) -> str:
-    if not math.isfinite(hours) or hours <= 0:
+    if not 0.0 < hours < math.inf:
         return "n/a"
-    total_minutes = int(round(hours * 60))
+    total_minutes = round(hours * 60)
     if total_minutes <= 0:
         return "~0m"
-    hours_part, minutes = divmod(total_minutes, 60)
-    days, hours_only = divmod(hours_part, 24)
-    parts: list[str] = []
+    days, minutes = divmod(total_minutes, 1440)
+    hours_only, minutes = divmod(minutes, 60)
     if days:
-        parts.append(f"{days}d")
+        if hours_only:
+            return f"{days}d {hours_only}h"
+        return f"{days}d {minutes}m" if minutes else f"{days}d"
     if hours_only:
-        parts.append(f"{hours_only}h")
-    if minutes and (not days or len(parts) < 2):
-        parts.append(f"{minutes}m")
-    if not parts:
-        return "~0m"
-    return " ".join(parts[:2])
+        return f"{hours_only}h {minutes}m" if minutes else f"{hours_only}h"
+    return f"{minutes}m"
 
 
 def main() -> int:
     parser, args = parse_args()
+    from _args import first_not_none, parse_int_sequence
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import DEFAULT_UPTIME_I2C_ADDRESSES, get_settings
+    from featherflap.hardware.battery import BatteryEstimator
+    from featherflap.hardware.i2c import SMBusNotAvailable
+    from featherflap.hardware.power import UPSReadings, read_ups
+
     settings = get_settings()
-    bus_id = args.bus_id if args.bus_id is not None else settings.i2c_bus_id
+    bus_id = first_not_none(args.bus_id, settings.i2c_bus_id)
     if args.addresses:
         try:
             addresses = parse_int_sequence(args.addresses, "I2C address")
@@ -122,10 +144,8 @@ def main() -> int:
     else:
         addresses = list(DEFAULT_UPTIME_I2C_ADDRESSES)
 
-    shunt = args.shunt_ohms if args.shunt_ohms is not None else settings.uptime_shunt_resistance_ohms
-    battery_capacity = (
-        args.capacity_mah if args.capacity_mah is not None else getattr(settings, "battery_capacity_mah", 10000.0)
-    )
+    shunt = first_not_none(args.shunt_ohms, settings.uptime_shunt_resistance_ohms)
+    battery_capacity = first_not_none(args.capacity_mah, settings.battery_capacity_mah)
 
     try:
         readings: UPSReadings = read_ups(bus_id, addresses, shunt)
@@ -158,79 +178,60 @@ def main() -> int:
         raw = f"{text:<18}"
         return palette.wrap(raw, palette.bold)
 
-    flow_labels = {
-        "discharging": "Supplying load",
-        "charging": "Charging battery",
-        "idle": "Near zero",
-        "unknown": "Current unavailable",
-    }
-    flow_colours = {
-        "discharging": palette.green,
-        "charging": palette.yellow,
-        "idle": palette.cyan,
-        "unknown": palette.dim,
-    }
-
     soc_colour = palette.green if soc_pct >= 80 else palette.yellow if soc_pct >= 40 else palette.red
 
-    print()
+    out = [""]
     heading = f"UPS telemetry @ address {hex(readings.address)}"
-    print(palette.wrap(heading, palette.bold, palette.blue))
+    out.append(palette.wrap(heading, palette.bold, palette.blue))
     separator = palette.wrap("-" * 40, palette.dim)
-    print(separator)
-    print(f"{fmt_label('I2C bus')}: {palette.wrap(str(bus_id), palette.cyan)}")
-    print(f"{fmt_label('Bus voltage')}: {palette.wrap(f'{readings.bus_voltage_v:>8.3f} V', palette.magenta)}")
+    out.append(separator)
+    out.append(f"{fmt_label('I2C bus')}: {palette.wrap(str(bus_id), palette.cyan)}")
+    out.append(f"{fmt_label('Bus voltage')}: {palette.wrap(f'{readings.bus_voltage_v:>8.3f} V', palette.magenta)}")
 
     if readings.shunt_voltage_mv is not None:
-        print(f"{fmt_label('Shunt voltage')}: {palette.wrap(f'{readings.shunt_voltage_mv:+8.3f} mV', palette.cyan)}")
+        out.append(f"{fmt_label('Shunt voltage')}: {palette.wrap(f'{readings.shunt_voltage_mv:+8.3f} mV', palette.cyan)}")
     else:
-        print(f"{fmt_label('Shunt voltage')}: {palette.wrap('n/a', palette.dim)}")
+        out.append(f"{fmt_label('Shunt voltage')}: {palette.wrap('n/a', palette.dim)}")
 
     if readings.current_ma is not None:
-        flow_text = flow_labels.get(readings.flow, "Current unavailable")
-        flow_colour = flow_colours.get(readings.flow, palette.dim)
+        flow_text = FLOW_LABELS.get(readings.flow, "Current unavailable")
+        flow_colour = FLOW_COLOURS.get(readings.flow, Palette.dim)
         current_value = abs(readings.current_ma)
         current_str = f"{current_value:>8.2f} mA"
-        print(
+        out.append(
             f"{fmt_label('Current')}: "
             f"{palette.wrap(current_str, palette.green)} "
             f"({palette.wrap(flow_text, flow_colour)})"
         )
     else:
-        print(f"{fmt_label('Current')}: {palette.wrap('n/a', palette.dim)} {palette.wrap('(set shunt value)', palette.dim)}")
+        out.append(f"{fmt_label('Current')}: {palette.wrap('n/a', palette.dim)} {palette.wrap('(set shunt value)', palette.dim)}")
 
     if readings.power_mw is not None and readings.current_ma is not None:
-        direction = (
-            "to load"
-            if readings.flow == "discharging"
-            else "into battery"
-            if readings.flow == "charging"
-            else "minimal flow"
-        )
-        direction_colour = flow_colours.get(readings.flow, palette.dim)
+        direction = FLOW_DIRECTIONS.get(readings.flow, "minimal flow")
+        direction_colour = FLOW_COLOURS.get(readings.flow, Palette.dim)
         power_w = abs(readings.power_mw) / 1000.0
-        print(
+        out.append(
             f"{fmt_label('Power')}: "
             f"{palette.wrap(f'{power_w:>8.3f} W', palette.magenta)} "
             f"({palette.wrap(direction, direction_colour)})"
         )
     elif readings.power_mw is not None:
         power_w = readings.power_mw / 1000.0
-        print(f"{fmt_label('Power')}: {palette.wrap(f'{power_w:>8.3f} W', palette.magenta)}")
+        out.append(f"{fmt_label('Power')}: {palette.wrap(f'{power_w:>8.3f} W', palette.magenta)}")
     else:
-        print(f"{fmt_label('Power')}: {palette.wrap('n/a', palette.dim)}")
+        out.append(f"{fmt_label('Power')}: {palette.wrap('n/a', palette.dim)}")
 
     soc_extra_parts = [f"voltage {estimate.voltage_soc_pct:.1f}%"]
     if estimate.coulomb_soc_pct is not None:
         soc_extra_parts.append(f"learned {estimate.coulomb_soc_pct:.1f}%")
     soc_extra = "; ".join(soc_extra_parts)
-    print(f"{fmt_label('Battery SoC')}: {palette.wrap(f'{soc_pct:>8.1f} %', soc_colour)} ({soc_extra})")
+    out.append(f"{fmt_label('Battery SoC')}: {palette.wrap(f'{soc_pct:>8.1f} %', soc_colour)} ({soc_extra})")
 
     nominal_capacity = battery_capacity
     capacity_colour = palette.green if capacity_mah >= nominal_capacity * 0.95 else palette.yellow
     if capacity_mah < nominal_capacity * 0.6:
         capacity_colour = palette.red
-    print(
+    out.append(
         f"{fmt_label('Capacity est.')}: "
         f"{palette.wrap(f'{capacity_mah:>8.0f} mAh', capacity_colour)} "
         f"(nominal {nominal_capacity:.0f} mAh)"
@@ -238,20 +239,23 @@ def main() -> int:
 
     if time_to_empty_hours is not None:
         eta = format_duration(time_to_empty_hours)
-        print(f"{fmt_label('Est. time remaining')}: {palette.wrap(eta, palette.green)}")
+        out.append(f"{fmt_label('Est. time remaining')}: {palette.wrap(eta, palette.green)}")
     if time_to_full_hours is not None:
         eta = format_duration(time_to_full_hours)
-        print(f"{fmt_label('Est. time to full')}: {palette.wrap(eta, palette.yellow)}")
+        out.append(f"{fmt_label('Est. time to full')}: {palette.wrap(eta, palette.yellow)}")
     if time_to_empty_hours is None and time_to_full_hours is None:
-        print(f"{fmt_label('Runtime estimate')}: {palette.wrap('n/a (insufficient current)', palette.dim)}")
+        out.append(f"{fmt_label('Runtime estimate')}: {palette.wrap('n/a (insufficient current)', palette.dim)}")
 
-    print(
+    out.append(
         f"{fmt_label('History samples')}: "
         f"{palette.wrap(str(estimate.samples_recorded), palette.cyan)}"
     )
 
-    print(separator)
-    print()
+    out.append(separator)
+    out.append("")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
+    sys.stdout.flush()
     return 0
 
 
@@ -7,19 +7,6 @@ import argparse
 import sys
 from pathlib import Path
 
-from _paths import add_project_src_to_path
-
-add_project_src_to_path()
-
-from featherflap.config import DEFAULT_CAMERA_DEVICE_INDEX, get_settings
-from featherflap.hardware.camera import (
-    CameraUnavailable,
-    DEFAULT_FRAME_HEIGHT,
-    DEFAULT_FRAME_WIDTH,
-    DEFAULT_JPEG_QUALITY,
-    capture_jpeg_frame,
-)
-
 
 def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     parser = argparse.ArgumentParser(
@@ -49,7 +36,10 @@ def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
         "--quality",
         type=int,
         default=None,
-        help="JPEG quality (10-95). Defaults to the project configuration.",
+        help=(
+            "JPEG quality (10-95). When omitted, the camera's native MJPEG frame is returned as-is "
+            "if the device supports it, otherwise the project default quality is used."
+        ),
     )
     parser.add_argument(
         "--output",
@@ -62,17 +52,23 @@ def parse_args() -> tuple[argparse.ArgumentParser, argparse.Namespace]:
 
 def main() -> int:
     _parser, args = parse_args()
-    settings = get_settings()
-    device = (
-        args.device
-        if args.device is not None
-        else settings.camera_device
-        if settings.camera_device is not None
-        else DEFAULT_CAMERA_DEVICE_INDEX
+    from _args import first_not_none
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import DEFAULT_CAMERA_DEVICE_INDEX, get_settings
+    from featherflap.hardware.camera import (
+        CameraUnavailable,
+        DEFAULT_FRAME_HEIGHT,
+        DEFAULT_FRAME_WIDTH,
+        capture_jpeg_frame,
     )
-    width = args.width if args.width is not None else getattr(settings, "camera_width", DEFAULT_FRAME_WIDTH)
-    height = args.height if args.height is not None else getattr(settings, "camera_height", DEFAULT_FRAME_HEIGHT)
-    quality = args.quality if args.quality is not None else getattr(settings, "camera_quality", DEFAULT_JPEG_QUALITY)
+
+    settings = get_settings()
+    device = first_not_none(args.device, settings.camera_device, DEFAULT_CAMERA_DEVICE_INDEX)
+    width = first_not_none(args.width, DEFAULT_FRAME_WIDTH)
+    height = first_not_none(args.height, DEFAULT_FRAME_HEIGHT)
+    quality = args.quality
 
     try:
         payload = capture_jpeg_frame(device=device, width=width, height=height, quality=quality)
@@ -4,19 +4,52 @@
 from __future__ import annotations
 
 import argparse
+import math
+import queue
 import sys
+import threading
 import time
-from datetime import datetime
+from typing import Optional, TextIO
 
-from _paths import add_project_src_to_path
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+LINE_TEMPLATE = (
+    "{timestamp} | bus={bus:.3f}V | current={current} | flow={flow} | soc={soc:.1f}% | capacity={capacity:.0f}mAh"
+    "{power}{tte}{ttf}"
+)
+LOG_QUEUE_SIZE = 256
 
-add_project_src_to_path()
 
-from featherflap.config import DEFAULT_UPTIME_I2C_ADDRESSES, get_settings
-from featherflap.hardware.battery import BatteryEstimator
-from featherflap.hardware.i2c import SMBusNotAvailable
-from featherflap.hardware.power import read_ups
-from _args import parse_int_sequence
+class _BackgroundWriter:
+    """Write log lines from a daemon thread so a slow stdout sink never delays polling."""
+
+    def __init__(self, maxsize: int = LOG_QUEUE_SIZE) -> None:
+        self._queue: queue.Queue[Optional[tuple[TextIO, str]]] = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="ups-monitor-log", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str, stream: Optional[TextIO] = None) -> None:
+        try:
+            self._queue.put_nowait((stream or sys.stdout, line))
+        except queue.Full:
+            pass  # Drop the line rather than stall the poll loop.
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush queued lines and stop the writer thread."""
+
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            stream, line = item
+            stream.write(line + "\n")
+            stream.flush()
 
 
 def parse_args() -> argparse.Namespace:
@@ -66,25 +99,46 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _sleep_until_next_tick(tick: float, interval: float) -> float:
+    """Sleep until the poll after ``tick``, dropping polls that are already overdue.
+
+    Returns the tick that was waited for so the caller can keep a fixed cadence.
+    """
+
+    tick += interval
+    now = time.monotonic()
+    if interval > 0 and now > tick:
+        tick += math.ceil((now - tick) / interval) * interval
+    time.sleep(max(0.0, tick - now))
+    return tick
+
+
 def main() -> int:
     args = parse_args()
+    from _args import first_not_none, parse_int_sequence
+    from _paths import add_project_src_to_path
+
+    add_project_src_to_path()
+    from featherflap.config import DEFAULT_UPTIME_I2C_ADDRESSES, get_settings
+    from featherflap.hardware.battery import BatteryEstimator
+    from featherflap.hardware.i2c import SMBusNotAvailable
+    from featherflap.hardware.power import read_ups
+
     settings = get_settings()
-    bus_id = args.bus_id if args.bus_id is not None else settings.i2c_bus_id
+    bus_id = first_not_none(args.bus_id, settings.i2c_bus_id)
     if args.addresses:
         try:
-            addresses = parse_int_sequence(args.addresses, "I2C address")
+            addresses = tuple(parse_int_sequence(args.addresses, "I2C address"))
         except argparse.ArgumentTypeError as exc:
             print(f"ERROR: {exc}", file=sys.stderr)
             return 2
     elif settings.uptime_i2c_addresses:
-        addresses = list(settings.uptime_i2c_addresses)
+        addresses = tuple(settings.uptime_i2c_addresses)
     else:
-        addresses = list(DEFAULT_UPTIME_I2C_ADDRESSES)
+        addresses = tuple(DEFAULT_UPTIME_I2C_ADDRESSES)
 
-    shunt = args.shunt_ohms if args.shunt_ohms is not None else settings.uptime_shunt_resistance_ohms
-    battery_capacity = (
-        args.capacity_mah if args.capacity_mah is not None else getattr(settings, "battery_capacity_mah", 10000.0)
-    )
+    shunt = first_not_none(args.shunt_ohms, settings.uptime_shunt_resistance_ohms)
+    battery_capacity = first_not_none(args.capacity_mah, settings.battery_capacity_mah)
     estimator = BatteryEstimator()
 
     print(
@@ -94,10 +148,15 @@ def main() -> int:
     if args.duration:
         print(f"Will stop after approximately {args.duration} minutes.")
 
-    stop_time = None if args.duration is None else time.time() + args.duration * 60.0
+    # Scheduling runs on the monotonic clock so NTP steps after boot cannot burst or stall polling;
+    # wall-clock time is only used for sample timestamps.
+    deadline = None if args.duration is None else time.monotonic() + args.duration * 60.0
 
+    writer = _BackgroundWriter()
+    interrupted = False
+    tick = time.monotonic()
     try:
-        while stop_time is None or time.time() <= stop_time:
+        while deadline is None or time.monotonic() <= deadline:
             start = time.time()
             try:
                 readings = read_ups(bus_id, addresses, shunt)
@@ -105,8 +164,11 @@ def main() -> int:
                 print("ERROR: smbus/smbus2 library is not installed.", file=sys.stderr)
                 return 2
             except RuntimeError as exc:
-                print(f"{datetime.now().isoformat()} | ERROR reading UPS: {exc}", file=sys.stderr)
-                time.sleep(args.interval)
+                writer.write(
+                    f"{time.strftime(TIMESTAMP_FORMAT, time.localtime(start))} | ERROR reading UPS: {exc}",
+                    sys.stderr,
+                )
+                tick = _sleep_until_next_tick(tick, args.interval)
                 continue
             estimate = estimator.record_sample(
                 timestamp=start,
@@ -116,30 +178,31 @@ def main() -> int:
                 nominal_capacity_mah=battery_capacity,
             )
 
-            power_w = None
+            power = ""
             if readings.power_mw is not None and readings.current_ma is not None:
-                power_w = abs(readings.power_mw) / 1000.0
-
-            line = [
-                datetime.now().isoformat(timespec="seconds"),
-                f"bus={readings.bus_voltage_v:.3f}V",
-                f"current={readings.current_ma:.0f}mA" if readings.current_ma is not None else "current=n/a",
-                f"flow={readings.flow}",
-                f"soc={estimate.soc_pct:.1f}%",
-                f"capacity={estimate.capacity_mah:.0f}mAh",
-            ]
-            if power_w is not None:
-                line.append(f"power={power_w:.2f}W")
-            if estimate.time_to_empty_hours is not None:
-                line.append(f"TTE={estimate.time_to_empty_hours*60:.0f}m")
-            if estimate.time_to_full_hours is not None:
-                line.append(f"TTF={estimate.time_to_full_hours*60:.0f}m")
-            print(" | ".join(line))
-
-            elapsed = time.time() - start
-            sleep_for = max(0.0, args.interval - elapsed)
-            time.sleep(sleep_for)
+                power = f" | power={abs(readings.power_mw) / 1000.0:.2f}W"
+            tte = estimate.time_to_empty_hours
+            ttf = estimate.time_to_full_hours
+            writer.write(
+                LINE_TEMPLATE.format(
+                    timestamp=time.strftime(TIMESTAMP_FORMAT, time.localtime(start)),
+                    bus=readings.bus_voltage_v,
+                    current="n/a" if readings.current_ma is None else f"{readings.current_ma:.0f}mA",
+                    flow=readings.flow,
+                    soc=estimate.soc_pct,
+                    capacity=estimate.capacity_mah,
+                    power=power,
+                    tte="" if tte is None else f" | TTE={tte * 60:.0f}m",
+                    ttf="" if ttf is None else f" | TTF={ttf * 60:.0f}m",
+                )
+            )
+
+            tick = _sleep_until_next_tick(tick, args.interval)
     except KeyboardInterrupt:
+        interrupted = True
+    finally:
+        writer.close()
+    if interrupted:
         print("\nStopping monitor.")
     return 0
 
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from threading import RLock
+from threading import Lock
 from typing import Any, Dict, List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+def _loads_json(raw: str | bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers catch both.
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# featherflap.logger depends on settings, so this module uses the stdlib logger directly.
+logger = logging.getLogger("featherflap.config")
+
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8000
 DEFAULT_LOG_LEVEL = "info"
@@ -37,6 +53,7 @@ DEFAULT_MOTION_POLL_INTERVAL_SECONDS = 0.25
 DEFAULT_CAMERA_RECORD_WIDTH = 1280
 DEFAULT_CAMERA_RECORD_HEIGHT = 720
 DEFAULT_CAMERA_RECORD_FPS = 15.0
+_JSON_OPENERS = frozenset('[{"')
 
 
 class TemperatureUnit(str, Enum):
@@ -188,8 +205,14 @@ class AppSettings(BaseSettings):
             raw = value.strip()
             if not raw:
                 return []
+            if raw[0] not in _JSON_OPENERS:
+                # Plain "17,27" / "17 27" / "0x11" specs: parse tokens directly instead of letting json fail first.
+                try:
+                    return [int(token, 0) for token in raw.replace(",", " ").split()]
+                except ValueError:
+                    pass
             try:
-                parsed = json.loads(raw)
+                parsed = _loads_json(raw)
             except json.JSONDecodeError:
                 tokens = [token for token in raw.replace(",", " ").split() if token]
                 if not tokens:
@@ -223,10 +246,13 @@ class AppSettings(BaseSettings):
             value = value.strip()
             if not value:
                 return []
-            try:
-                parsed = json.loads(value)
-            except json.JSONDecodeError:
+            if value[0] not in _JSON_OPENERS:
                 parsed = [value]
+            else:
+                try:
+                    parsed = _loads_json(value)
+                except json.JSONDecodeError:
+                    parsed = [value]
             raw_windows = parsed if isinstance(parsed, list) else [parsed]
         elif isinstance(value, (list, tuple)):
             raw_windows = list(value)
@@ -265,49 +291,121 @@ PERSISTED_FIELDS = {
     "recording_max_seconds",
     "recording_min_gap_seconds",
 }
+# Persisted field name -> whether it is a Path that must be stored as a string, resolved once at import.
+_PERSISTED_FIELD_IS_PATH = {name: AppSettings.model_fields[name].annotation is Path for name in PERSISTED_FIELDS}
 
-_SETTINGS_LOCK = RLock()
+# Only writers take the lock; readers rely on the atomic rebinding of _SETTINGS.
+_SETTINGS_LOCK = Lock()
 _SETTINGS: AppSettings | None = None
+# (st_mtime_ns, st_size) of the runtime overrides file paired with its parsed contents.
+_OVERRIDES_CACHE: tuple[tuple[int, int], Dict[str, Any]] | None = None
 
 
 def _load_runtime_overrides() -> Dict[str, Any]:
-    if not RUNTIME_CONFIG_PATH.exists():
+    global _OVERRIDES_CACHE
+    try:
+        stat = RUNTIME_CONFIG_PATH.stat()
+    except OSError:
         return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _OVERRIDES_CACHE
+    # Callers mutate the returned overrides (update_settings), so never hand out the cached payload.
+    if cached is not None and cached[0] == key:
+        return copy.deepcopy(cached[1])
     try:
-        data = json.loads(RUNTIME_CONFIG_PATH.read_text())
+        data = _loads_json(RUNTIME_CONFIG_PATH.read_bytes())
         if isinstance(data, dict):
-            return data
+            _OVERRIDES_CACHE = (key, data)
+            return copy.deepcopy(data)
     except Exception:
         pass
     return {}
 
 
+def _dump_runtime_overrides(overrides: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(overrides, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(overrides, indent=2, sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
 def _write_runtime_overrides(overrides: Dict[str, Any]) -> None:
+    global _OVERRIDES_CACHE
     try:
-        RUNTIME_CONFIG_PATH.write_text(json.dumps(overrides, indent=2, sort_keys=True))
+        RUNTIME_CONFIG_PATH.write_bytes(_dump_runtime_overrides(overrides))
     except Exception:
-        logger = logging.getLogger("featherflap.config")
         logger.warning("Failed to persist runtime configuration overrides to %s", RUNTIME_CONFIG_PATH)
+    _OVERRIDES_CACHE = None
+
+
+def _env_signature() -> tuple:
+    """Return a cheap fingerprint of every input AppSettings reads from the environment."""
+
+    env = tuple(sorted((key, value) for key, value in os.environ.items() if key.upper().startswith("FEATHERFLAP_")))
+    try:
+        stat = os.stat(".env")
+    except OSError:
+        return env, None
+    return env, (stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _env_base(signature: tuple) -> AppSettings:
+    """Parse and validate AppSettings once per distinct environment signature."""
+
+    return AppSettings()
+
+
+# The only mutable values settings hold; every other field is immutable and safe to share.
+_LIST_FIELDS = ("allowed_origins", "pir_pins", "uptime_i2c_addresses", "sleep_windows")
+
+
+def _detach(value: Any) -> Any:
+    """Copy a list value, including the ``sleep_windows`` dicts, one level deep."""
+
+    if not isinstance(value, list):
+        return value
+    return [dict(item) if isinstance(item, dict) else item for item in value]
+
+
+def _detach_lists(update: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy list values so new settings never share them with the caller."""
+
+    return {key: _detach(value) for key, value in update.items()}
+
+
+def _copy_settings(settings: AppSettings, update: Dict[str, Any]) -> AppSettings:
+    """Shallow ``model_copy`` that gives the copy its own list fields.
+
+    ``update`` must not be shared with anything else; its values are used as-is.
+    """
+
+    detached = {name: _detach(getattr(settings, name)) for name in _LIST_FIELDS if name not in update}
+    return settings.model_copy(update={**detached, **update})
 
 
 def _load_settings() -> AppSettings:
     """Instantiate settings from the environment and runtime overrides."""
 
-    base = AppSettings()
+    # The cached base is never handed out; each load returns its own copy.
+    base = _env_base(_env_signature())
+    # _load_runtime_overrides already returns a private copy, so it is applied without detaching again.
     overrides = _load_runtime_overrides()
     if overrides:
         try:
-            base = base.model_copy(update=overrides, deep=True)
+            return _copy_settings(base, overrides)
         except Exception:
-            logger = logging.getLogger("featherflap.config")
             logger.warning("Ignoring invalid runtime overrides: %s", overrides)
-    return base
+    return _copy_settings(base, {})
 
 
 def get_settings() -> AppSettings:
     """Return the current application settings, loading them if necessary."""
 
     global _SETTINGS
+    settings = _SETTINGS
+    if settings is not None:
+        # Fast path: rebinding _SETTINGS is atomic, so a loaded instance can be returned without locking.
+        return settings
     with _SETTINGS_LOCK:
         if _SETTINGS is None:
             _SETTINGS = _load_settings()
@@ -328,32 +426,33 @@ def update_settings(changes: Dict[str, Any]) -> AppSettings:
 
     global _SETTINGS
     with _SETTINGS_LOCK:
-        current = get_settings()
-        updated = current.model_copy(update=changes, deep=True)
+        current = _SETTINGS if _SETTINGS is not None else _load_settings()
+        updated = _copy_settings(current, _detach_lists(changes))
         _SETTINGS = updated
 
         overrides = _load_runtime_overrides()
-        for key in PERSISTED_FIELDS:
-            if key in changes:
-                value = getattr(updated, key)
-                if isinstance(value, Path):
-                    overrides[key] = str(value)
-                else:
-                    overrides[key] = value
+        for key in changes:
+            is_path = _PERSISTED_FIELD_IS_PATH.get(key)
+            if is_path is None:
+                continue
+            value = getattr(updated, key)
+            overrides[key] = str(value) if is_path else value
         _write_runtime_overrides(overrides)
 
         return _SETTINGS
 
 
+# Celsius is the identity conversion and is deliberately absent.
+_TEMPERATURE_CONVERTERS = {
+    TemperatureUnit.FAHRENHEIT: lambda value_c: value_c * 9.0 / 5.0 + 32.0,
+    TemperatureUnit.KELVIN: lambda value_c: value_c + 273.15,
+}
+
+
 def convert_temperature(value_c: Optional[float], unit: TemperatureUnit) -> Optional[float]:
     """Convert a Celsius reading into the configured unit."""
 
     if value_c is None:
         return None
-    if unit is TemperatureUnit.CELSIUS:
-        return value_c
-    if unit is TemperatureUnit.FAHRENHEIT:
-        return value_c * 9.0 / 5.0 + 32.0
-    if unit is TemperatureUnit.KELVIN:
-        return value_c + 273.15
-    return value_c
+    converter = _TEMPERATURE_CONVERTERS.get(unit)
+    return value_c if converter is None else converter(value_c)
@@ -1,9 +1,8 @@
 """Hardware diagnostic suite for FeatherFlap."""
 
-from ..logger import get_logger
 from .base import HardwareStatus, HardwareTest, HardwareTestResult
 from .camera import CameraUnavailable, capture_jpeg_frame, mjpeg_stream
-from .battery import BatteryEstimate, BatteryEstimator, voltage_to_soc
+from .battery import BatteryEstimate, BatteryEstimator, BatteryState, voltage_to_soc
 from .pir import PIRUnavailable, read_pir_states
 from .picamera import PicameraUnavailable, capture_picamera_jpeg, picamera_mjpeg_stream
 from .power import UPSReadings, read_ups
@@ -12,8 +11,6 @@ from .registry import HardwareTestRegistry
 from .sensors import EnvironmentSnapshot, read_environment
 from .tests import default_tests
 
-get_logger(__name__).debug("Hardware diagnostic package loaded")
-
 __all__ = [
     "HardwareStatus",
     "HardwareTest",
@@ -31,6 +28,7 @@ __all__ = [
     "set_rgb_led_color",
     "BatteryEstimate",
     "BatteryEstimator",
+    "BatteryState",
     "voltage_to_soc",
     "CameraUnavailable",
     "capture_jpeg_frame",
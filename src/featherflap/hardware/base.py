@@ -6,10 +6,6 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from ..logger import get_logger
-
-logger = get_logger(__name__)
-
 
 class HardwareStatus(str, Enum):
     """Standard result categories used throughout diagnostics."""
@@ -33,15 +29,13 @@ class HardwareTestResult:
     def to_dict(self) -> Dict[str, Any]:
         """Return a JSON-serialisable representation of the result."""
 
-        payload = {
+        return {
             "id": self.id,
             "name": self.name,
             "status": self.status.value,
             "summary": self.summary,
             "details": self.details,
         }
-        logger.debug("Serialised HardwareTestResult: %s", payload)
-        return payload
 
 
 class HardwareTest:
@@ -51,6 +45,8 @@ class HardwareTest:
     name: str = "Unnamed Test"
     description: str = "No description provided."
     category: str = "general"
+    # Tests naming the same resource (e.g. "i2c") never run concurrently in run_all; None means no shared hardware.
+    resource: Optional[str] = None
 
     def run(self) -> HardwareTestResult:
         """Execute the hardware check and return a structured result."""
@@ -60,11 +56,9 @@ class HardwareTest:
     def to_metadata(self) -> Dict[str, Optional[str]]:
         """Return metadata describing the test."""
 
-        metadata = {
+        return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
             "category": self.category,
         }
-        logger.debug("Serialised HardwareTest metadata: %s", metadata)
-        return metadata
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import math
+import os
+import threading
 import time
-from dataclasses import dataclass
+import weakref
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, fields
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
 
 DEFAULT_DATA_DIR = Path.home() / ".local/share/featherflap"
 STATE_FILENAME = "battery_state.json"
 HISTORY_FILENAME = "battery_samples.jsonl"
+HISTORY_FLUSH_SAMPLES = 32  # Buffered history lines written per append to battery_samples.jsonl.
+HISTORY_FLUSH_SECONDS = 30.0  # Oldest age a buffered sample may reach before it is written out.
 
 # Approximate Li-Ion discharge curve (voltage -> state-of-charge %).
 BATTERY_SOC_CURVE = [
@@ -49,22 +61,36 @@ CAPACITY_SMOOTHING = 0.3  # EWMA factor when updating learnt capacity.
 MIN_CURRENT_FOR_RUNTIME_A = 0.05  # 50 mA threshold for estimating runtime.
 
 
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=asdict).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# Ascending views of BATTERY_SOC_CURVE with per-segment slopes, so lookups bisect instead of scanning.
+_CURVE_VOLTAGES = tuple(voltage for voltage, _ in reversed(BATTERY_SOC_CURVE))
+_CURVE_SOCS = tuple(soc for _, soc in reversed(BATTERY_SOC_CURVE))
+_CURVE_SLOPES = tuple(
+    (_CURVE_SOCS[i + 1] - _CURVE_SOCS[i]) / (_CURVE_VOLTAGES[i + 1] - _CURVE_VOLTAGES[i])
+    for i in range(len(_CURVE_VOLTAGES) - 1)
+)
+
+
 def voltage_to_soc(voltage: float) -> float:
     """Map a voltage reading to an approximate SoC percentage."""
 
-    curve = BATTERY_SOC_CURVE
-    if voltage >= curve[0][0]:
-        return 100.0
-    if voltage <= curve[-1][0]:
+    index = bisect_left(_CURVE_VOLTAGES, voltage)
+    if index <= 0:
         return 0.0
-    for (v_hi, soc_hi), (v_lo, soc_lo) in zip(curve, curve[1:]):
-        if v_lo <= voltage <= v_hi:
-            span = v_hi - v_lo
-            if span <= 0:
-                return soc_lo
-            fraction = (voltage - v_lo) / span
-            return soc_lo + fraction * (soc_hi - soc_lo)
-    return max(0.0, min(100.0, curve[-1][1]))
+    if index >= len(_CURVE_VOLTAGES):
+        return 100.0
+    lower = index - 1
+    return _CURVE_SOCS[lower] + (voltage - _CURVE_VOLTAGES[lower]) * _CURVE_SLOPES[lower]
 
 
 @dataclass
@@ -80,6 +106,23 @@ class BatteryEstimate:
     samples_recorded: int
 
 
+@dataclass(slots=True)
+class BatteryState:
+    """Learned coulomb-counting state persisted between samples."""
+
+    learned_capacity_mah: Optional[float] = None
+    soc_coulomb: Optional[float] = None
+    discharge_since_full_ah: float = 0.0
+    charge_since_empty_ah: float = 0.0
+    last_timestamp: Optional[float] = None
+    last_current_a: Optional[float] = None
+    last_flow: Optional[str] = None
+    samples_recorded: int = 0
+
+
+_STATE_FIELDS = frozenset(field.name for field in fields(BatteryState))
+
+
 class BatteryEstimator:
     """Persist battery telemetry and learn refined capacity/runtime estimates."""
 
@@ -89,42 +132,66 @@ class BatteryEstimator:
         self.state_path = self.data_dir / STATE_FILENAME
         self.history_path = self.data_dir / HISTORY_FILENAME
         self.state = self._load_state()
+        self._history_buffer: List[bytes] = []
+        self._history_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        _OPEN_ESTIMATORS.add(self)
 
     # ------------------------------------------------------------------
     # State persistence helpers
     # ------------------------------------------------------------------
 
-    def _load_state(self) -> Dict[str, object]:
-        default = {
-            "learned_capacity_mah": None,
-            "soc_coulomb": None,
-            "discharge_since_full_ah": 0.0,
-            "charge_since_empty_ah": 0.0,
-            "last_timestamp": None,
-            "last_current_a": None,
-            "last_flow": None,
-            "samples_recorded": 0,
-        }
+    def _load_state(self) -> BatteryState:
         if not self.state_path.exists():
-            return default
+            return BatteryState()
         try:
-            loaded = json.loads(self.state_path.read_text())
+            loaded = _loads(self.state_path.read_bytes())
         except json.JSONDecodeError:
-            return default
-        default.update(loaded)
-        return default
+            return BatteryState()
+        # Ignore keys written by other versions so an old state file never blocks startup.
+        return BatteryState(**{key: value for key, value in loaded.items() if key in _STATE_FIELDS})
 
     def _save_state(self) -> None:
-        self.state_path.write_text(json.dumps(self.state))
+        # Write a sibling temp file and swap it in, so a crash mid-write never leaves a torn
+        # state file and a replaced or deleted state file is simply recreated.
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_bytes(_dumps(self.state))
+        os.replace(tmp_path, self.state_path)
 
     def _append_history(self, sample: Dict[str, object]) -> None:
-        with self.history_path.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(sample) + "\n")
+        line = _dumps(sample) + b"\n"
+        with self._history_lock:
+            self._history_buffer.append(line)
+            due = (
+                len(self._history_buffer) >= HISTORY_FLUSH_SAMPLES
+                or time.monotonic() - self._last_flush >= HISTORY_FLUSH_SECONDS
+            )
+        if due:
+            self.flush()
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    def flush(self) -> None:
+        """Write buffered history samples to disk."""
+
+        # The estimator is shared across worker threads; the lock keeps a concurrent append from
+        # landing between the join and the clear, and keeps batches in order on disk.
+        with self._history_lock:
+            self._last_flush = time.monotonic()
+            if not self._history_buffer:
+                return
+            lines = b"".join(self._history_buffer)
+            self._history_buffer.clear()
+            with self.history_path.open("ab") as fh:
+                fh.write(lines)
+
+    def close(self) -> None:
+        """Flush buffered history (run automatically at exit)."""
+
+        self.flush()
+
     def record_sample(
         self,
         *,
@@ -148,6 +215,8 @@ class BatteryEstimator:
         }
         self._append_history(sample)
 
+        # State is saved on every sample: the capacity learned at the empty threshold is recorded
+        # just before the UPS cuts power, when exit hooks no longer run.
         self._update_state(ts, voltage_v, current_a, flow, nominal_capacity_mah)
         self._save_state()
 
@@ -167,77 +236,82 @@ class BatteryEstimator:
     ) -> None:
         state = self.state
 
-        learned_capacity_mah = state.get("learned_capacity_mah") or nominal_capacity_mah
-        capacity_ah_ref = max(0.1, learned_capacity_mah / 1000.0)
-
-        last_timestamp = state.get("last_timestamp")
-        last_flow = state.get("last_flow")
-        last_current_a = state.get("last_current_a") or 0.0
-
-        # Coulomb counting when samples are close enough.
-        if last_timestamp is not None:
-            delta_seconds = timestamp - float(last_timestamp)
+        if flow != "discharging" and flow != "charging":
+            # Idle/unknown samples never count coulombs, reset counters or seed the SoC,
+            # so only the bookkeeping fields change.
+            state.last_timestamp = timestamp
+            state.last_current_a = current_a
+            state.last_flow = flow
+            state.samples_recorded += 1
+            return
+
+        last_timestamp = state.last_timestamp
+        last_flow = state.last_flow
+        soc_coulomb = state.soc_coulomb
+        learned_capacity_mah = state.learned_capacity_mah
+        discharge_since_full = state.discharge_since_full_ah
+        charge_since_empty = state.charge_since_empty_ah
+
+        # Coulomb counting when samples are close enough and the flow direction continued.
+        if last_timestamp is not None and flow == last_flow:
+            delta_seconds = timestamp - last_timestamp
             if 0 < delta_seconds <= MAX_DELTA_SECONDS:
-                delta_hours = delta_seconds / 3600.0
+                last_current_a = state.last_current_a or 0.0
                 avg_current = (abs(current_a) + abs(last_current_a)) / 2.0
-                if last_flow == "discharging" and flow == "discharging":
-                    discharge_ah = avg_current * delta_hours
-                    state["discharge_since_full_ah"] = float(state.get("discharge_since_full_ah", 0.0)) + discharge_ah
-                    if state.get("soc_coulomb") is not None:
-                        state["soc_coulomb"] = max(
-                            0.0,
-                            float(state["soc_coulomb"]) - discharge_ah / capacity_ah_ref,
-                        )
-                elif last_flow == "charging" and flow == "charging":
-                    charge_ah = avg_current * delta_hours
-                    state["charge_since_empty_ah"] = float(state.get("charge_since_empty_ah", 0.0)) + charge_ah
-                    if state.get("soc_coulomb") is not None:
-                        state["soc_coulomb"] = min(
-                            1.0,
-                            float(state["soc_coulomb"]) + charge_ah / capacity_ah_ref,
-                        )
+                amp_hours = avg_current * (delta_seconds / 3600.0)
+                soc_delta = amp_hours / max(0.1, (learned_capacity_mah or nominal_capacity_mah) / 1000.0)
+                if flow == "discharging":
+                    discharge_since_full += amp_hours
+                    if soc_coulomb is not None:
+                        soc_coulomb = max(0.0, soc_coulomb - soc_delta)
+                else:
+                    charge_since_empty += amp_hours
+                    if soc_coulomb is not None:
+                        soc_coulomb = min(1.0, soc_coulomb + soc_delta)
 
         # Detect near-full / near-empty events to reset counters and learn capacity.
-        discharge_since_full = float(state.get("discharge_since_full_ah", 0.0))
-        charge_since_empty = float(state.get("charge_since_empty_ah", 0.0))
         nominal_ah = max(0.1, nominal_capacity_mah / 1000.0)
         min_cycle_ah = nominal_ah * MIN_CYCLE_FRACTION
 
         if flow == "charging" and voltage_v >= FULL_VOLTAGE_THRESHOLD:
             if discharge_since_full >= min_cycle_ah:
-                observed_capacity_mah = discharge_since_full * 1000.0
-                previous = state.get("learned_capacity_mah")
-                if previous:
-                    updated = (1.0 - CAPACITY_SMOOTHING) * float(previous) + CAPACITY_SMOOTHING * observed_capacity_mah
-                else:
-                    updated = observed_capacity_mah
-                state["learned_capacity_mah"] = max(updated, nominal_capacity_mah * MIN_CYCLE_FRACTION)
-            state["soc_coulomb"] = 1.0
-            state["discharge_since_full_ah"] = 0.0
-            state["charge_since_empty_ah"] = 0.0
+                learned_capacity_mah = self._learn_capacity(
+                    learned_capacity_mah, discharge_since_full * 1000.0, nominal_capacity_mah
+                )
+            soc_coulomb = 1.0
+            discharge_since_full = 0.0
+            charge_since_empty = 0.0
         elif flow == "discharging" and voltage_v <= EMPTY_VOLTAGE_THRESHOLD:
             if charge_since_empty >= min_cycle_ah:
-                observed_capacity_mah = charge_since_empty * 1000.0
-                previous = state.get("learned_capacity_mah")
-                if previous:
-                    updated = (1.0 - CAPACITY_SMOOTHING) * float(previous) + CAPACITY_SMOOTHING * observed_capacity_mah
-                else:
-                    updated = observed_capacity_mah
-                state["learned_capacity_mah"] = max(updated, nominal_capacity_mah * MIN_CYCLE_FRACTION)
-            state["soc_coulomb"] = 0.0
-            state["charge_since_empty_ah"] = 0.0
+                learned_capacity_mah = self._learn_capacity(
+                    learned_capacity_mah, charge_since_empty * 1000.0, nominal_capacity_mah
+                )
+            soc_coulomb = 0.0
+            charge_since_empty = 0.0
 
         # Initialise coulomb counter when encountering obvious full charge.
-        if state.get("soc_coulomb") is None:
+        if soc_coulomb is None:
             if voltage_v >= FULL_VOLTAGE_THRESHOLD and flow == "charging":
-                state["soc_coulomb"] = 1.0
+                soc_coulomb = 1.0
             elif voltage_v <= EMPTY_VOLTAGE_THRESHOLD and flow == "discharging":
-                state["soc_coulomb"] = 0.0
-
-        state["last_timestamp"] = timestamp
-        state["last_current_a"] = current_a
-        state["last_flow"] = flow
-        state["samples_recorded"] = int(state.get("samples_recorded", 0)) + 1
+                soc_coulomb = 0.0
+
+        state.learned_capacity_mah = learned_capacity_mah
+        state.soc_coulomb = soc_coulomb
+        state.discharge_since_full_ah = discharge_since_full
+        state.charge_since_empty_ah = charge_since_empty
+        state.last_timestamp = timestamp
+        state.last_current_a = current_a
+        state.last_flow = flow
+        state.samples_recorded += 1
+
+    @staticmethod
+    def _learn_capacity(previous: Optional[float], observed_capacity_mah: float, nominal_capacity_mah: float) -> float:
+        if previous:
+            updated = (1.0 - CAPACITY_SMOOTHING) * float(previous) + CAPACITY_SMOOTHING * observed_capacity_mah
+        else:
+            updated = observed_capacity_mah
+        return max(updated, nominal_capacity_mah * MIN_CYCLE_FRACTION)
 
     def _build_estimate(
         self,
@@ -247,9 +321,9 @@ class BatteryEstimator:
         nominal_capacity_mah: float,
     ) -> BatteryEstimate:
         state = self.state
-        learned_capacity = float(state.get("learned_capacity_mah") or nominal_capacity_mah)
+        learned_capacity = float(state.learned_capacity_mah or nominal_capacity_mah)
         voltage_soc = voltage_to_soc(voltage_v)
-        coulomb_soc = state.get("soc_coulomb")
+        coulomb_soc = state.soc_coulomb
         if coulomb_soc is not None:
             blended_soc = (voltage_soc + coulomb_soc * 100.0) / 2.0
         else:
@@ -275,5 +349,17 @@ class BatteryEstimator:
             capacity_mah=learned_capacity,
             time_to_empty_hours=None if time_to_empty is None else float(time_to_empty),
             time_to_full_hours=None if time_to_full is None else float(time_to_full),
-            samples_recorded=int(state.get("samples_recorded", 0)),
+            samples_recorded=state.samples_recorded,
         )
+
+
+_OPEN_ESTIMATORS: "weakref.WeakSet[BatteryEstimator]" = weakref.WeakSet()
+
+
+def _close_open_estimators() -> None:
+    # One exit hook for every estimator; the weak set does not keep discarded ones alive.
+    for estimator in list(_OPEN_ESTIMATORS):
+        estimator.close()
+
+
+atexit.register(_close_open_estimators)
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import atexit
 import time
 from contextlib import contextmanager
 import threading
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Any, Callable, Generator, Optional, Tuple
 
 from ..logger import get_logger
 
@@ -14,6 +15,7 @@ DEFAULT_DEVICE_INDEX = 0
 DEFAULT_FRAME_WIDTH = 640
 DEFAULT_FRAME_HEIGHT = 480
 DEFAULT_JPEG_QUALITY = 80
+DEFAULT_WARMUP_FRAMES = 2
 DEFAULT_STREAM_JPEG_QUALITY = 75
 JPEG_QUALITY_MIN = 10
 JPEG_QUALITY_MAX = 95
@@ -21,8 +23,27 @@ STREAM_QUALITY_MAX = 90
 MIN_STREAM_FPS = 1.0
 DEFAULT_STREAM_FPS = 10.0
 FRAME_INTERVAL_BASE_SECONDS = 1.0
+JPEG_SOI = b"\xff\xd8"
+MJPEG_PART_PREFIX = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+CAPTURE_POOL_IDLE_SECONDS = 30.0
+STREAM_FRAME_TIMEOUT_SECONDS = 5.0
+STREAM_STOP_TIMEOUT_SECONDS = 1.0
+RECORD_H264_BITRATE = 2_000_000
+# Hand frames to the SoC's V4L2 memory-to-memory H.264 encoder instead of encoding MPEG-4 on the CPU.
+RECORD_H264_PIPELINE = (
+    "appsrc ! videoconvert ! video/x-raw,format=I420 "
+    "! v4l2h264enc extra-controls=\"controls,video_bitrate={bitrate}\" ! video/x-h264,level=(string)4 "
+    "! h264parse ! mp4mux ! filesink location=\"{path}\""
+)
+# Characters that would end the quoted filesink location or start a new pipeline element.
+RECORD_PIPELINE_UNSAFE_CHARS = frozenset('"!\\')
 logger = get_logger(__name__)
-_cv2_loaded = False
+_cv2 = None
+_CAPTURE_POOL_LOCK = threading.Lock()
+_pooled_capture: Optional[Tuple[Tuple[int | str, Optional[int], Optional[int], bool], Any]] = None
+_pool_timer: Optional[threading.Timer] = None
+_turbojpeg = None
+_turbojpeg_checked = False
 
 
 class CameraUnavailable(RuntimeError):
@@ -30,20 +51,72 @@ class CameraUnavailable(RuntimeError):
 
 
 def _ensure_cv2():
-    global _cv2_loaded
+    global _cv2
+    if _cv2 is not None:
+        return _cv2
     try:
         import cv2  # type: ignore
     except ImportError as exc:  # pragma: no cover - optional dependency
         logger.error("OpenCV import failed: %s", exc)
         raise CameraUnavailable("OpenCV (cv2) is not installed.") from exc
-    if not _cv2_loaded:
-        logger.debug("OpenCV library successfully loaded")
-        _cv2_loaded = True
+    logger.debug("OpenCV library successfully loaded")
+    _cv2 = cv2
     return cv2
 
 
-@contextmanager
-def _open_capture(device: int | str, width: Optional[int], height: Optional[int]):
+def _load_turbojpeg():
+    """Return a shared TurboJPEG encoder, or ``None`` when PyTurboJPEG/libturbojpeg is unavailable."""
+
+    global _turbojpeg, _turbojpeg_checked
+    if _turbojpeg_checked:
+        return _turbojpeg
+    _turbojpeg_checked = True
+    try:
+        from turbojpeg import TJFLAG_FASTDCT, TurboJPEG  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    try:
+        encoder = TurboJPEG()
+    except (OSError, RuntimeError) as exc:  # pragma: no cover - native library missing
+        logger.debug("libturbojpeg unavailable, using OpenCV JPEG encoder: %s", exc)
+        return None
+    _turbojpeg = (encoder, TJFLAG_FASTDCT)
+    logger.debug("Using libturbojpeg for JPEG encoding")
+    return _turbojpeg
+
+
+def _jpeg_encoder(quality: int) -> Callable[[Any], Optional[bytes | memoryview]]:
+    """Return a frame -> JPEG buffer callable, preferring libturbojpeg's SIMD fast-DCT path over ``cv2.imencode``.
+
+    The OpenCV path returns a memoryview over the encoded ndarray rather than calling ``tobytes()``,
+    so callers that frame the JPEG (``b"".join``) copy it exactly once.
+    """
+
+    turbo = _load_turbojpeg()
+    if turbo is not None:
+        encoder, fast_dct = turbo
+        return lambda frame: encoder.encode(frame, quality=quality, flags=fast_dct)
+    cv2 = _ensure_cv2()
+    imencode = cv2.imencode
+    encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), quality]
+
+    def encode(frame) -> Optional[memoryview]:
+        success, encoded = imencode(".jpg", frame, encode_params)
+        return memoryview(encoded).cast("B") if success else None
+
+    return encode
+
+
+def _native_jpeg(frame) -> memoryview:
+    return memoryview(frame).cast("B")
+
+
+def _encode_jpeg(frame, quality: int) -> Optional[bytes]:
+    payload = _jpeg_encoder(quality)(frame)
+    return None if payload is None else bytes(payload)
+
+
+def _create_capture(device: int | str, width: Optional[int], height: Optional[int], native_mjpeg: bool):
     cv2 = _ensure_cv2()
     index = device if isinstance(device, int) else str(device)
     logger.debug("Opening camera device %s (width=%s height=%s)", index, width, height)
@@ -52,43 +125,203 @@ def _open_capture(device: int | str, width: Optional[int], height: Optional[int]
         capture.release()
         logger.error("Unable to open camera device %s", index)
         raise CameraUnavailable(f"Unable to open camera device {index}.")
+    if native_mjpeg:
+        # Ask for the camera's own MJPEG stream (before sizing, as V4L2 negotiates format first)
+        # and have OpenCV hand back the compressed buffer instead of decoding it to BGR.
+        capture.set(cv2.CAP_PROP_FOURCC, float(cv2.VideoWriter_fourcc(*"MJPG")))
+        capture.set(cv2.CAP_PROP_CONVERT_RGB, 0.0)
     if width:
         capture.set(cv2.CAP_PROP_FRAME_WIDTH, float(width))
     if height:
         capture.set(cv2.CAP_PROP_FRAME_HEIGHT, float(height))
+    return capture
+
+
+def release_capture_pool() -> None:
+    """Close the capture kept open between ``capture_jpeg_frame`` calls, if any."""
+
+    global _pooled_capture, _pool_timer
+    with _CAPTURE_POOL_LOCK:
+        pooled, _pooled_capture = _pooled_capture, None
+        timer, _pool_timer = _pool_timer, None
+    if timer is not None:
+        timer.cancel()
+    if pooled is not None:
+        logger.debug("Releasing pooled camera device %s", pooled[0][0])
+        pooled[1].release()
+
+
+atexit.register(release_capture_pool)
+
+
+def _acquire_pooled_capture(key: Tuple[int | str, Optional[int], Optional[int], bool]) -> Tuple[Any, bool]:
+    """Return ``(capture, reused)``, where ``reused`` is true for a warm capture taken from the pool."""
+
+    global _pooled_capture
+    with _CAPTURE_POOL_LOCK:
+        pooled = _pooled_capture
+        if pooled is not None and pooled[0] == key:
+            _pooled_capture = None
+            return pooled[1], True
+    # A different device or format is pooled; free it so the V4L2 node is not held busy.
+    release_capture_pool()
+    return _create_capture(*key), False
+
+
+def _return_pooled_capture(key: Tuple[int | str, Optional[int], Optional[int], bool], capture) -> None:
+    global _pooled_capture, _pool_timer
+    with _CAPTURE_POOL_LOCK:
+        if _pooled_capture is None:
+            _pooled_capture = (key, capture)
+            if _pool_timer is not None:
+                _pool_timer.cancel()
+            # Close the camera again once snapshots stop, so an idle device does not drain the battery.
+            _pool_timer = threading.Timer(CAPTURE_POOL_IDLE_SECONDS, release_capture_pool)
+            _pool_timer.daemon = True
+            _pool_timer.start()
+            return
+    capture.release()
+
+
+@contextmanager
+def _open_capture(device: int | str, width: Optional[int], height: Optional[int], *, native_mjpeg: bool = False):
+    # Streams and recordings need exclusive use of the device, so drop any pooled snapshot capture first.
+    release_capture_pool()
+    capture = _create_capture(device, width, height, native_mjpeg)
     try:
         yield capture
     finally:
-        logger.debug("Releasing camera device %s", index)
+        logger.debug("Releasing camera device %s", device)
         capture.release()
 
 
+def _retrieve_fresh_frame(capture):
+    ok, frame = capture.retrieve() if capture.grab() else (False, None)
+    if not ok or frame is None:
+        logger.error("Camera frame capture failed: empty frame received")
+        raise CameraUnavailable("Camera opened but did not deliver a frame.")
+    return frame
+
+
 def capture_jpeg_frame(
     device: int | str = DEFAULT_DEVICE_INDEX,
     width: Optional[int] = DEFAULT_FRAME_WIDTH,
     height: Optional[int] = DEFAULT_FRAME_HEIGHT,
-    quality: int = DEFAULT_JPEG_QUALITY,
+    quality: Optional[int] = DEFAULT_JPEG_QUALITY,
+    warmup_frames: int = DEFAULT_WARMUP_FRAMES,
 ) -> bytes:
-    """Capture a single frame and return it as JPEG bytes."""
+    """Capture a single frame and return it as JPEG bytes.
+
+    On a freshly opened device the first ``warmup_frames`` frames are skipped with ``grab()`` so
+    the sensor's dark, auto-exposure-unstable startup frames are discarded without being decoded;
+    a warm pooled device only drops its one stale queued frame. Passing
+    ``quality=None`` returns the camera's native MJPEG frame untouched when the device supports
+    it, skipping the colour conversion and JPEG re-encode entirely. The device stays open for
+    ``CAPTURE_POOL_IDLE_SECONDS`` afterwards so back-to-back snapshots skip the V4L2 open.
+    """
 
     logger.debug("Capturing JPEG frame (device=%s width=%s height=%s quality=%s)", device, width, height, quality)
-    with _open_capture(device, width, height) as capture:
-        ok, frame = capture.read()
-        if not ok or frame is None:
-            logger.error("Camera frame capture failed: empty frame received")
-            raise CameraUnavailable("Camera opened but did not deliver a frame.")
-        cv2 = _ensure_cv2()
-        encode_params = [
-            int(cv2.IMWRITE_JPEG_QUALITY),
-            int(max(JPEG_QUALITY_MIN, min(JPEG_QUALITY_MAX, quality))),
-        ]
-        success, encoded = cv2.imencode(".jpg", frame, encode_params)
-        if not success:
-            logger.error("Camera frame encoding failed")
-            raise CameraUnavailable("Failed to encode camera frame as JPEG.")
-        payload = encoded.tobytes()
-        logger.info("Captured single JPEG frame (%d bytes)", len(payload))
-        return payload
+    cv2 = _ensure_cv2()
+    native_mjpeg = quality is None
+    key = (device if isinstance(device, int) else str(device), width, height, native_mjpeg)
+    capture, reused = _acquire_pooled_capture(key)
+    skip_frames = min(warmup_frames, 1) if reused else warmup_frames
+    try:
+        payload = _capture_jpeg_payload(cv2, capture, quality, skip_frames)
+    except BaseException:
+        capture.release()
+        raise
+    _return_pooled_capture(key, capture)
+    return payload
+
+
+def _capture_jpeg_payload(cv2, capture, quality: Optional[int], warmup_frames: int) -> bytes:
+    native_mjpeg = quality is None
+    # Keep the V4L2 queue to a single buffer and skip warm-up frames without decoding,
+    # so the one frame we decode is fresh rather than the oldest of several buffered ones.
+    capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    for _ in range(max(0, warmup_frames)):
+        capture.grab()
+    frame = _retrieve_fresh_frame(capture)
+    if native_mjpeg:
+        payload = frame.tobytes()
+        if payload[:2] == JPEG_SOI:
+            logger.info("Captured native MJPEG frame (%d bytes)", len(payload))
+            return payload
+        logger.debug("Camera did not deliver MJPEG; falling back to software JPEG encoding")
+        capture.set(cv2.CAP_PROP_CONVERT_RGB, 1.0)
+        frame = _retrieve_fresh_frame(capture)
+        quality = DEFAULT_JPEG_QUALITY
+    payload = _encode_jpeg(frame, int(max(JPEG_QUALITY_MIN, min(JPEG_QUALITY_MAX, quality))))
+    if payload is None:
+        logger.error("Camera frame encoding failed")
+        raise CameraUnavailable("Failed to encode camera frame as JPEG.")
+    logger.info("Captured single JPEG frame (%d bytes)", len(payload))
+    return payload
+
+
+class _LatestFrame:
+    """Single-slot, latest-wins hand-off from the capture thread to the stream generator."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._frame: Any = None
+        self._seq = 0
+        self._failed = False
+        self._wanted = False
+
+    def wanted(self) -> bool:
+        """Return whether a consumer is waiting for a frame newer than the one in the slot."""
+
+        return self._wanted
+
+    def put(self, frame: Any) -> None:
+        with self._condition:
+            self._frame = frame
+            self._seq += 1
+            self._wanted = False
+            self._condition.notify_all()
+
+    def fail(self) -> None:
+        with self._condition:
+            self._failed = True
+            self._condition.notify_all()
+
+    def get(self, last_seq: int, timeout: float) -> Tuple[int, Any]:
+        """Wait for a frame newer than ``last_seq``; the frame is ``None`` on failure or timeout."""
+
+        with self._condition:
+            self._wanted = True
+            ready = self._condition.wait_for(lambda: self._seq != last_seq or self._failed, timeout)
+            if not ready or self._failed:
+                return last_seq, None
+            return self._seq, self._frame
+
+
+def _read_frames(capture, latest: _LatestFrame, stop: threading.Event) -> None:
+    """Keep the V4L2 queue drained with ``grab()``, decoding only when the stream wants a frame.
+
+    The thread owns ``capture`` and releases it on exit, so the device is never released while
+    a ``grab()`` is still in flight.
+    """
+
+    grab = capture.grab
+    retrieve = capture.retrieve
+    try:
+        while not stop.is_set():
+            if not grab():
+                latest.fail()
+                return
+            if not latest.wanted():
+                continue
+            ok, frame = retrieve()
+            if not ok or frame is None:
+                latest.fail()
+                return
+            latest.put(frame)
+    finally:
+        logger.debug("Releasing camera stream capture")
+        capture.release()
 
 
 def mjpeg_stream(
@@ -96,9 +329,13 @@ def mjpeg_stream(
     width: Optional[int] = DEFAULT_FRAME_WIDTH,
     height: Optional[int] = DEFAULT_FRAME_HEIGHT,
     fps: float = DEFAULT_STREAM_FPS,
-    quality: int = DEFAULT_STREAM_JPEG_QUALITY,
+    quality: Optional[int] = DEFAULT_STREAM_JPEG_QUALITY,
 ) -> Generator[bytes, None, None]:
-    """Yield multipart MJPEG frames suitable for a StreamingResponse."""
+    """Yield multipart MJPEG frames suitable for a StreamingResponse.
+
+    Passing ``quality=None`` forwards the camera's own MJPEG frames without decoding or
+    re-encoding them, falling back to software encoding if the device does not deliver MJPEG.
+    """
 
     frame_interval = FRAME_INTERVAL_BASE_SECONDS / max(MIN_STREAM_FPS, fps)
     logger.info(
@@ -109,37 +346,83 @@ def mjpeg_stream(
         fps,
         quality,
     )
-    with _open_capture(device, width, height) as capture:
-        cv2 = _ensure_cv2()
-        encode_params = [
-            int(cv2.IMWRITE_JPEG_QUALITY),
-            int(max(JPEG_QUALITY_MIN, min(STREAM_QUALITY_MAX, quality))),
-        ]
-        while True:
-            start = time.monotonic()
+    native_mjpeg = quality is None
+    # Streams need exclusive use of the device, so drop any pooled snapshot capture first.
+    release_capture_pool()
+    capture = _create_capture(device, width, height, native_mjpeg)
+    latest = _LatestFrame()
+    stop = threading.Event()
+    try:
+        encode = None
+        if native_mjpeg:
             ok, frame = capture.read()
-            if not ok or frame is None:
+            if ok and frame is not None and _native_jpeg(frame)[:2] == JPEG_SOI:
+                encode = _native_jpeg
+            else:
+                logger.debug("Camera did not deliver MJPEG; falling back to software JPEG encoding")
+                capture.set(_ensure_cv2().CAP_PROP_CONVERT_RGB, 1.0)
+                quality = DEFAULT_STREAM_JPEG_QUALITY
+        if encode is None:
+            encode = _jpeg_encoder(int(max(JPEG_QUALITY_MIN, min(STREAM_QUALITY_MAX, quality))))
+        # A reader thread keeps grabbing so the V4L2 wait overlaps encoding and sending, and
+        # decodes only when the generator asks for the next frame; it releases the device itself.
+        reader = threading.Thread(
+            target=_read_frames, args=(capture, latest, stop), name="featherflap-mjpeg-capture", daemon=True
+        )
+        reader.start()
+    except BaseException:
+        capture.release()
+        raise
+    monotonic = time.monotonic
+    sleep = time.sleep
+    get = latest.get
+    seq = 0
+    try:
+        # Schedule frames against absolute deadlines so per-frame jitter does not accumulate as drift.
+        deadline = monotonic()
+        while True:
+            seq, frame = get(seq, STREAM_FRAME_TIMEOUT_SECONDS)
+            if frame is None:
                 logger.error("Camera stream halted: capture returned empty frame")
                 raise CameraUnavailable("Camera stream halted unexpectedly.")
-            success, encoded = cv2.imencode(".jpg", frame, encode_params)
-            if not success:
+            payload = encode(frame)
+            if payload is None:
                 logger.error("Camera stream encoding failed")
                 raise CameraUnavailable("Failed to encode camera frame as JPEG.")
-            payload = encoded.tobytes()
             logger.debug("Encoded MJPEG frame (%d bytes)", len(payload))
-            yield (
-                b"--frame\r\n"
-                b"Content-Type: image/jpeg\r\n"
-                b"Content-Length: "
-                + str(len(payload)).encode("ascii")
-                + b"\r\n\r\n"
-                + payload
-                + b"\r\n"
-            )
-            elapsed = time.monotonic() - start
-            sleep_time = frame_interval - elapsed
+            yield b"".join((MJPEG_PART_PREFIX, b"%d\r\n\r\n" % len(payload), payload, b"\r\n"))
+            deadline += frame_interval
+            sleep_time = deadline - monotonic()
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                sleep(sleep_time)
+            else:
+                # Fell behind (slow client or camera): restart the schedule rather than bursting to catch up.
+                deadline = monotonic()
+    finally:
+        stop.set()
+        reader.join(STREAM_STOP_TIMEOUT_SECONDS)
+        if reader.is_alive():
+            logger.warning(
+                "Camera reader thread did not stop within %.1fs; it releases the device when it exits",
+                STREAM_STOP_TIMEOUT_SECONDS,
+            )
+
+
+def _open_video_writer(cv2, output_path: Path, fps: float, size: Tuple[int, int]):
+    """Open a hardware H.264 writer through GStreamer, falling back to OpenCV's software mp4v encoder."""
+
+    path = str(output_path)
+    if RECORD_PIPELINE_UNSAFE_CHARS.isdisjoint(path):
+        pipeline = RECORD_H264_PIPELINE.format(bitrate=RECORD_H264_BITRATE, path=path)
+        writer = cv2.VideoWriter(pipeline, cv2.CAP_GSTREAMER, 0, float(fps), size, True)
+        if writer.isOpened():
+            logger.debug("Recording with the hardware H.264 encoder")
+            return writer
+        writer.release()
+        logger.debug("GStreamer H.264 encoder unavailable; recording with OpenCV's mp4v encoder")
+    else:
+        logger.debug("Output path %s cannot be embedded in a GStreamer pipeline; recording with mp4v", path)
+    return cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), float(fps), size)
 
 
 def record_video(
@@ -152,16 +435,19 @@ def record_video(
     max_seconds: int = 30,
     stop_event: Optional[threading.Event] = None,
 ) -> None:
-    """Record a video clip to ``output_path`` using OpenCV."""
+    """Record a video clip to ``output_path`` using OpenCV.
+
+    Frames are encoded to H.264 on the SoC's hardware encoder when OpenCV was built with GStreamer
+    and ``v4l2h264enc`` is present, otherwise with OpenCV's software MPEG-4 encoder.
+    """
 
     if fps <= 0:
         raise ValueError("FPS must be positive.")
     duration_limit = max(1, max_seconds)
     stop_event = stop_event or threading.Event()
     cv2 = _ensure_cv2()
-    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
     with _open_capture(device, width, height) as capture:
-        writer = cv2.VideoWriter(str(output_path), fourcc, float(fps), (int(width), int(height)))
+        writer = _open_video_writer(cv2, output_path, fps, (int(width), int(height)))
         start = time.monotonic()
         frame_interval = 1.0 / fps
         frame_count = 0
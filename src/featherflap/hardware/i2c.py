@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Sequence
 
 from ..logger import get_logger
 
 try:  # pragma: no cover - optional dependency
-    from smbus2 import SMBus  # type: ignore
+    from smbus2 import SMBus, i2c_msg  # type: ignore
 except ImportError:  # pragma: no cover - optional dependency
+    i2c_msg = None  # type: ignore
     try:
         from smbus import SMBus  # type: ignore
     except ImportError:  # pragma: no cover - optional dependency
@@ -44,3 +45,24 @@ def has_smbus() -> bool:
     available = SMBus is not None
     logger.debug("SMBus availability check: %s", available)
     return available
+
+
+def read_registers(bus, address: int, registers: Sequence[int], length: int = 2) -> List[bytes]:
+    """Read ``length`` bytes from each register, batching into one I2C_RDWR transfer when possible.
+
+    Each register is fetched with a pointer write followed by a repeated-start read, so this
+    works for devices such as the INA219 that do not auto-increment their register pointer.
+    Falls back to one block read per register when the bus lacks ``i2c_rdwr`` (python-smbus).
+    """
+
+    if i2c_msg is not None and hasattr(bus, "i2c_rdwr"):
+        messages = []
+        reads = []
+        for register in registers:
+            read = i2c_msg.read(address, length)
+            messages.append(i2c_msg.write(address, [register]))
+            messages.append(read)
+            reads.append(read)
+        bus.i2c_rdwr(*messages)
+        return [bytes(read) for read in reads]
+    return [bytes(bus.read_i2c_block_data(address, register, length)) for register in registers]
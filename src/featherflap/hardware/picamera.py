@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
 import io
+import threading
 import time
 from contextlib import suppress
-from typing import Generator, Tuple
+from typing import Any, Generator, Optional, Tuple
 
 from ..logger import get_logger
+from .camera import MJPEG_PART_PREFIX, STREAM_FRAME_TIMEOUT_SECONDS, _LatestFrame
 
+PICAMERA_IDLE_SECONDS = 30.0
 logger = get_logger(__name__)
+_PICAMERA_LOCK = threading.Lock()
+_pooled_picamera: Optional[Tuple[Tuple[int, int], Any]] = None
+_picamera_timer: Optional[threading.Timer] = None
 
 
 class PicameraUnavailable(RuntimeError):
@@ -25,34 +32,138 @@ def _ensure_picamera2():
     return Picamera2
 
 
+def _close_picamera(picam) -> None:
+    with suppress(Exception):
+        picam.stop()
+    picam.close()
+
+
+def release_picamera() -> None:
+    """Close the Picamera2 instance kept warm between ``capture_picamera_jpeg`` calls, if any."""
+
+    global _pooled_picamera, _picamera_timer
+    with _PICAMERA_LOCK:
+        pooled, _pooled_picamera = _pooled_picamera, None
+        timer, _picamera_timer = _picamera_timer, None
+    if timer is not None:
+        timer.cancel()
+    if pooled is not None:
+        logger.debug("Closing pooled Picamera2 instance")
+        _close_picamera(pooled[1])
+
+
+atexit.register(release_picamera)
+
+
+def _acquire_picamera(size: Tuple[int, int]) -> Tuple[Any, bool]:
+    """Return a started Picamera2 for ``size`` and whether its pipeline was (re)started just now."""
+
+    global _pooled_picamera
+    Picamera2 = _ensure_picamera2()
+    with _PICAMERA_LOCK:
+        pooled, _pooled_picamera = _pooled_picamera, None
+    if pooled is not None:
+        pooled_size, picam = pooled
+        if pooled_size == size:
+            return picam, False
+        try:
+            # Same camera, new resolution: reconfigure in place instead of re-opening libcamera.
+            picam.stop()
+            picam.configure(picam.create_still_configuration(main={"size": size}))
+            picam.start()
+            return picam, True
+        except Exception as exc:  # pragma: no cover - hardware interaction
+            logger.debug("Reconfiguring pooled Picamera2 failed, reopening: %s", exc)
+            _close_picamera(picam)
+    picam = Picamera2()
+    try:
+        picam.configure(picam.create_still_configuration(main={"size": size}))
+        picam.start()
+    except Exception:
+        _close_picamera(picam)
+        raise
+    return picam, True
+
+
+def _return_picamera(size: Tuple[int, int], picam) -> None:
+    global _pooled_picamera, _picamera_timer
+    with _PICAMERA_LOCK:
+        if _pooled_picamera is None:
+            _pooled_picamera = (size, picam)
+            if _picamera_timer is not None:
+                _picamera_timer.cancel()
+            # Shut the sensor down again once snapshots stop, so an idle camera does not drain the battery.
+            _picamera_timer = threading.Timer(PICAMERA_IDLE_SECONDS, release_picamera)
+            _picamera_timer.daemon = True
+            _picamera_timer.start()
+            return
+    _close_picamera(picam)
+
+
 def capture_picamera_jpeg(
     size: Tuple[int, int] = (1296, 972),
     quality: int = 90,
     warmup_seconds: float = 0.15,
 ) -> bytes:
-    """Capture a single JPEG frame from the CSI camera."""
+    """Capture a single JPEG frame from the CSI camera.
+
+    The camera stays configured and running for ``PICAMERA_IDLE_SECONDS`` afterwards, so repeated
+    snapshots skip libcamera start-up and the AE/AWB warm-up.
+    """
 
-    Picamera2 = _ensure_picamera2()
     logger.debug("Capturing CSI frame (size=%s quality=%s)", size, quality)
-    picam = Picamera2()
-    config = picam.create_still_configuration(main={"size": size})
-    picam.configure(config)
+    size = tuple(size)
     try:
-        picam.start()
-        if warmup_seconds > 0:
+        picam, started = _acquire_picamera(size)
+    except PicameraUnavailable:
+        raise
+    except Exception as exc:  # pragma: no cover - hardware interaction
+        logger.error("CSI camera start failed: %s", exc)
+        raise PicameraUnavailable("Failed to capture from Picamera2.") from exc
+    try:
+        if started and warmup_seconds > 0:
             time.sleep(warmup_seconds)
         buffer = io.BytesIO()
         picam.capture_file(buffer, format="jpeg", quality=quality)
         payload = buffer.getvalue()
-        logger.info("Captured CSI frame (%d bytes)", len(payload))
-        return payload
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("CSI frame capture failed: %s", exc)
+        _close_picamera(picam)
         raise PicameraUnavailable("Failed to capture from Picamera2.") from exc
-    finally:
+    _return_picamera(size, picam)
+    logger.info("Captured CSI frame (%d bytes)", len(payload))
+    return payload
+
+
+class _FrameOutput(io.BufferedIOBase):
+    """Writable target for Picamera2's ``FileOutput``; each ``write`` carries one complete JPEG."""
+
+    def __init__(self, latest: _LatestFrame) -> None:
+        super().__init__()
+        self._latest = latest
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, frame: Any) -> int:
+        self._latest.put(bytes(frame))
+        return len(frame)
+
+
+def _start_jpeg_recording(picam, output: _FrameOutput, quality: int) -> None:
+    """Encode frames on the VideoCore JPEG block, or with Picamera2's software encoder without one."""
+
+    from picamera2.encoders import JpegEncoder, MJPEGEncoder, Quality  # type: ignore
+    from picamera2.outputs import FileOutput  # type: ignore
+
+    presets = (Quality.VERY_LOW, Quality.LOW, Quality.MEDIUM, Quality.HIGH, Quality.VERY_HIGH)
+    try:
+        picam.start_recording(MJPEGEncoder(), FileOutput(output), quality=presets[max(0, min(4, (quality - 1) // 20))])
+    except Exception as exc:  # pragma: no cover - hardware interaction (e.g. Pi 5 has no JPEG block)
+        logger.info("Hardware MJPEG encoder unavailable (%s); using software JPEG encoder", exc)
         with suppress(Exception):
-            picam.stop()
-        picam.close()
+            picam.stop_recording()
+        picam.start_recording(JpegEncoder(q=quality), FileOutput(output))
 
 
 def picamera_mjpeg_stream(
@@ -60,40 +171,34 @@ def picamera_mjpeg_stream(
     fps: float = 15.0,
     quality: int = 85,
 ) -> Generator[bytes, None, None]:
-    """Yield multipart MJPEG frames from the CSI camera."""
+    """Yield multipart MJPEG frames from the CSI camera.
+
+    Frames are JPEG-encoded by Picamera2's encoder pipeline (the hardware MJPEG encoder where the
+    SoC has one) and paced by the sensor's frame rate; only the newest frame is sent to the client.
+    """
 
     Picamera2 = _ensure_picamera2()
     logger.info("Starting Picamera2 MJPEG stream (size=%s fps=%s)", size, fps)
+    # libcamera allows one Picamera2 per sensor, so close any instance kept warm for snapshots.
+    release_picamera()
     picam = Picamera2()
-    config = picam.create_video_configuration(main={"size": size})
+    config = picam.create_video_configuration(main={"size": size}, controls={"FrameRate": max(1.0, fps)})
     picam.configure(config)
-    frame_interval = 1.0 / max(1.0, fps)
+    latest = _LatestFrame()
     try:
-        picam.start()
+        _start_jpeg_recording(picam, _FrameOutput(latest), quality)
+        seq = 0
         while True:
-            start = time.monotonic()
-            buffer = io.BytesIO()
-            picam.capture_file(buffer, format="jpeg", quality=quality)
-            payload = buffer.getvalue()
+            seq, payload = latest.get(seq, STREAM_FRAME_TIMEOUT_SECONDS)
+            if payload is None:
+                raise RuntimeError("no frame received from the encoder")
             logger.debug("Picamera2 MJPEG frame (%d bytes)", len(payload))
-            yield (
-                b"--frame\r\n"
-                b"Content-Type: image/jpeg\r\n"
-                b"Content-Length: "
-                + str(len(payload)).encode("ascii")
-                + b"\r\n\r\n"
-                + payload
-                + b"\r\n"
-            )
-            elapsed = time.monotonic() - start
-            delay = frame_interval - elapsed
-            if delay > 0:
-                time.sleep(delay)
+            yield b"".join((MJPEG_PART_PREFIX, b"%d\r\n\r\n" % len(payload), payload, b"\r\n"))
     except Exception as exc:  # pragma: no cover - defensive
         logger.error("Picamera2 MJPEG stream failed: %s", exc)
         raise PicameraUnavailable("CSI streaming halted unexpectedly.") from exc
     finally:
         with suppress(Exception):
-            picam.stop()
+            picam.stop_recording()
         picam.close()
         logger.info("Stopped Picamera2 MJPEG stream")
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import glob
 from contextlib import suppress
-from typing import Dict, Iterable
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 from ..logger import get_logger
 
+PIR_GPIO_CONSUMER = "featherflap-pir"
+PIR_PULL = "down"  # Bias applied to PIR inputs by both GPIO backends: "down", "up" or "off".
+# Kernel labels of the SoC GPIO controller whose line offsets are the BCM numbers RPi.GPIO uses.
+BCM_GPIO_CHIP_LABELS = frozenset({"pinctrl-bcm2835", "pinctrl-bcm2711", "pinctrl-rp1"})
+_GPIOD_BIAS = {"down": "PULL_DOWN", "up": "PULL_UP", "off": "DISABLED"}
+_RPI_GPIO_PULL = {"down": "PUD_DOWN", "up": "PUD_UP", "off": "PUD_OFF"}
 logger = get_logger(__name__)
 
 
@@ -14,20 +22,76 @@ class PIRUnavailable(RuntimeError):
     """Raised when PIR sensors cannot be accessed."""
 
 
-def read_pir_states(pins: Iterable[int]) -> Dict[int, int]:
+@lru_cache(maxsize=1)
+def _bcm_gpio_chip() -> Optional[str]:
+    """Return the gpiochip device of the BCM GPIO controller, or ``None`` if none is found."""
+
+    import gpiod  # type: ignore
+
+    for path in sorted(glob.glob("/dev/gpiochip*")):
+        try:
+            if not gpiod.is_gpiochip_device(path):
+                continue
+            with gpiod.Chip(path) as chip:
+                if chip.get_info().label in BCM_GPIO_CHIP_LABELS:
+                    return path
+        except OSError:  # pragma: no cover - hardware interaction
+            continue
+    return None
+
+
+def _read_with_gpiod(pins: List[int], pull: str) -> Optional[Dict[int, int]]:
+    """Read every pin through one libgpiod line request, or return ``None`` if libgpiod cannot be used."""
+
+    try:
+        import gpiod  # type: ignore
+        from gpiod.line import Bias, Direction, Value  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency (or libgpiod 1.x bindings)
+        return None
+    chip = _bcm_gpio_chip()
+    if chip is None:
+        logger.debug("No BCM GPIO controller found through libgpiod, falling back to RPi.GPIO")
+        return None
+    settings = gpiod.LineSettings(direction=Direction.INPUT, bias=getattr(Bias, _GPIOD_BIAS[pull]))
+    try:
+        # The lines are released again straight away so run mode can still claim them for edge detection.
+        with gpiod.request_lines(chip, consumer=PIR_GPIO_CONSUMER, config={tuple(pins): settings}) as request:
+            values = request.get_values(pins)
+    except (OSError, ValueError) as exc:  # pragma: no cover - hardware interaction
+        logger.debug("libgpiod request for PIR pins failed, falling back to RPi.GPIO: %s", exc)
+        return None
+    return {pin: int(value == Value.ACTIVE) for pin, value in zip(pins, values)}
+
+
+def read_pir_states(pins: Iterable[int], pull: str = PIR_PULL) -> Dict[int, int]:
     """Return the current digital states for the provided PIR sensor pins.
 
     Parameters
     ----------
     pins:
         Iterable of BCM pin numbers to read.
+    pull:
+        Input bias, ``"down"``, ``"up"`` or ``"off"``; applied identically by both backends.
 
     Returns
     -------
     dict
         Mapping of pin number to GPIO state (0 or 1).
+
+    All pins are configured and sampled with a single libgpiod request when the ``gpiod`` (v2)
+    bindings are installed and the BCM GPIO controller is found; otherwise each pin is set up and
+    read through RPi.GPIO.
     """
 
+    if pull not in _GPIOD_BIAS:
+        raise ValueError(f"Unsupported PIR pull mode: {pull!r}")
+    pins = [int(pin) for pin in pins]
+    if pins:
+        bulk = _read_with_gpiod(pins, pull)
+        if bulk is not None:
+            logger.info("PIR sensor states read successfully: %s", bulk)
+            return bulk
+
     try:
         import RPi.GPIO as GPIO  # type: ignore
     except ImportError as exc:  # pragma: no cover - optional dependency
@@ -37,11 +101,10 @@ def read_pir_states(pins: Iterable[int]) -> Dict[int, int]:
     GPIO.setwarnings(False)
     GPIO.setmode(GPIO.BCM)
     states: Dict[int, int] = {}
-    pins = [int(pin) for pin in pins]
     logger.debug("Reading PIR sensor states for GPIO pins: %s", pins)
     try:
         for pin in pins:
-            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+            GPIO.setup(pin, GPIO.IN, pull_up_down=getattr(GPIO, _RPI_GPIO_PULL[pull]))
             states[pin] = int(GPIO.input(pin))
     except Exception as exc:  # pragma: no cover - hardware interaction
         logger.error("Failed to read PIR sensors: %s", exc)
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
 from ..logger import get_logger
-from .i2c import SMBusNotAvailable, open_bus
+from .i2c import SMBusNotAvailable, open_bus, read_registers
 
 INA219_REG_CONFIG = 0x00
 INA219_REG_SHUNT_VOLTAGE = 0x01
@@ -16,11 +16,13 @@ INA219_BUS_VOLTAGE_LSB = 0.004  # 4 mV
 INA219_SHUNT_VOLTAGE_LSB = 0.00001  # 10 µV
 
 CURRENT_IDLE_THRESHOLD_MA = 10.0
+# Last address that answered on each bus; tried first so steady-state polls skip dead addresses.
+_LAST_RESPONDING_ADDRESS: Dict[int, int] = {}
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UPSReadings:
     """Structured response returned when the UPS responds successfully."""
 
@@ -46,22 +48,6 @@ class UPSReadings:
         return payload
 
 
-def _read_word_be(bus, address: int, register: int) -> int:
-    """Read a big-endian 16-bit register from the INA219."""
-
-    raw = bus.read_word_data(address, register)
-    value = ((raw & 0xFF) << 8) | ((raw >> 8) & 0xFF)
-    logger.debug("Read register 0x%02X from 0x%X: 0x%04X", register, address, value)
-    return value
-
-
-def _read_signed_word_be(bus, address: int, register: int) -> int:
-    value = _read_word_be(bus, address, register)
-    if value & 0x8000:
-        value -= 0x10000
-    return value
-
-
 def _classify_current(current_ma: Optional[float]) -> str:
     if current_ma is None:
         return "unknown"
@@ -75,14 +61,15 @@ def _classify_current(current_ma: Optional[float]) -> str:
 
 
 def _read_ina219(bus, address: int, shunt_resistance_ohms: float) -> UPSReadings:
-    # Validate device by reading the config register; failure raises OSError.
-    _ = _read_word_be(bus, address, INA219_REG_CONFIG)
+    # Both registers are fetched in one transfer; a missing device NACKs and raises OSError.
+    shunt_bytes, bus_bytes = read_registers(bus, address, (INA219_REG_SHUNT_VOLTAGE, INA219_REG_BUS_VOLTAGE))
+    shunt_voltage_raw = int.from_bytes(shunt_bytes, "big", signed=True)
+    bus_voltage_raw = int.from_bytes(bus_bytes, "big")
+    logger.debug("Read INA219 at 0x%X: shunt=0x%04X bus=0x%04X", address, shunt_voltage_raw & 0xFFFF, bus_voltage_raw)
 
-    bus_voltage_raw = _read_word_be(bus, address, INA219_REG_BUS_VOLTAGE)
     bus_voltage_reg = (bus_voltage_raw >> 3) & 0x1FFF
     bus_voltage_v = bus_voltage_reg * INA219_BUS_VOLTAGE_LSB
 
-    shunt_voltage_raw = _read_signed_word_be(bus, address, INA219_REG_SHUNT_VOLTAGE)
     shunt_voltage_v = shunt_voltage_raw * INA219_SHUNT_VOLTAGE_LSB
     shunt_voltage_mv = shunt_voltage_v * 1000.0
 
@@ -111,6 +98,10 @@ def read_ups(bus_id: int, addresses: Iterable[int], shunt_resistance_ohms: float
     if not address_attempts:
         logger.error("UPS read requested without addresses")
         raise ValueError("At least one UPS I²C address must be provided.")
+    preferred = _LAST_RESPONDING_ADDRESS.get(bus_id)
+    if preferred is not None and preferred != address_attempts[0] and preferred in address_attempts:
+        address_attempts.remove(preferred)
+        address_attempts.insert(0, preferred)
 
     logger.debug(
         "Attempting UPS read on bus %s for addresses %s (shunt=%.5fΩ)",
@@ -129,6 +120,7 @@ def read_ups(bus_id: int, addresses: Iterable[int], shunt_resistance_ohms: float
                 except Exception as exc:  # pragma: no cover - defensive
                     logger.warning("Unexpected INA219 read failure at %s: %s", hex(address), exc)
                     continue
+                _LAST_RESPONDING_ADDRESS[bus_id] = address
                 flow = readings.flow.replace("-", " ")
                 if readings.current_ma is not None:
                     display_current = f"{abs(readings.current_ma):.1f}mA"
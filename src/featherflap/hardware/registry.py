@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
 
 from ..logger import get_logger
 from .base import HardwareTest, HardwareTestResult
@@ -57,10 +59,33 @@ class HardwareTestRegistry:
         logger.info("Hardware test '%s' completed with status %s", result.id, result.status.value)
         return result
 
-    def run_all(self) -> List[HardwareTestResult]:
-        """Execute all registered tests in insertion order."""
-
-        logger.info("Running full hardware test suite (%d tests)", len(self.tests))
-        results = [test.run() for test in self.tests.values()]
+    def run_all(self, parallel: bool = True) -> List[HardwareTestResult]:
+        """Execute all registered tests, returning results in insertion order.
+
+        With ``parallel`` enabled, tests are grouped by their ``resource`` and the groups run
+        concurrently (each group sequentially), so the suite takes roughly as long as its slowest
+        bus rather than the sum of every test's I/O waits.
+        """
+
+        tests = list(self.tests.values())
+        logger.info("Running full hardware test suite (%d tests)", len(tests))
+        if not parallel or len(tests) < 2:
+            results = [test.run() for test in tests]
+        else:
+            groups: Dict[object, List[int]] = {}
+            for index, test in enumerate(tests):
+                # Tests without a shared resource each get a group of their own.
+                groups.setdefault(test.resource if test.resource is not None else index, []).append(index)
+            slots: List[Optional[HardwareTestResult]] = [None] * len(tests)
+
+            def run_group(indices: List[int]) -> None:
+                for index in indices:
+                    slots[index] = tests[index].run()
+
+            workers = min(len(groups), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="featherflap-diag") as pool:
+                for future in [pool.submit(run_group, indices) for indices in groups.values()]:
+                    future.result()
+            results = [result for result in slots if result is not None]
         logger.info("Completed full hardware test suite")
         return results
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ..logger import get_logger
 from .i2c import SMBusNotAvailable, open_bus
 
+ENVIRONMENT_MAX_AGE_SECONDS = 0.5  # Matches the BMP280 standby time; fresher reads return the same values.
 logger = get_logger(__name__)
+# Drivers keep their one-time setup (soft reset, calibration) across reads, keyed by (bus id, driver, address).
+_DRIVERS: Dict[Tuple[int, str, int], Any] = {}
+# Latest snapshot per (bus id, AHT20 address, BMP280 address) with the monotonic time it was taken.
+_SNAPSHOTS: Dict[Tuple[int, int, int], Tuple[float, EnvironmentSnapshot]] = {}
+_SENSOR_LOCK = threading.Lock()
 
 
 @dataclass
@@ -22,6 +29,14 @@ class EnvironmentSnapshot:
     def healthy(self) -> bool:
         return not self.errors
 
+    def copy(self) -> "EnvironmentSnapshot":
+        """Return an independent copy, so callers sharing a cached snapshot cannot alter it."""
+
+        return EnvironmentSnapshot(
+            results={name: dict(values) for name, values in self.results.items()},
+            errors=dict(self.errors),
+        )
+
 
 class BMP280:
     """Minimal BMP280 driver for temperature and pressure."""
@@ -34,12 +49,20 @@ class BMP280:
     def __init__(self, bus, address: int) -> None:
         self._bus = bus
         self._address = address
+        self._cal: Dict[str, int] = {}
+        # Store oversampling configuration (x1 for temp/pressure, sleep mode).
+        self._ctrl_meas = 0x24
+
+    def bind(self, bus) -> None:
+        """Point the driver at a newly opened bus handle, keeping its one-time setup."""
+
+        self._bus = bus
+
+    def _initialize(self) -> None:
         self._cal = self._load_calibration()
         # Configure IIR filter off, standby time 500ms to reduce noise.
         self._bus.write_byte_data(self._address, self.CONFIG, 0xA0)
-        # Store oversampling configuration (x1 for temp/pressure, sleep mode).
-        self._ctrl_meas = 0x24
-        logger.debug("Initialised BMP280 driver at address 0x%X", address)
+        logger.debug("Initialised BMP280 driver at address 0x%X", self._address)
 
     def _load_calibration(self):
         data = self._bus.read_i2c_block_data(self._address, self.CALIB_START, 24)
@@ -94,6 +117,8 @@ class BMP280:
         return pressure
 
     def read(self) -> Tuple[float, float]:
+        if not self._cal:
+            self._initialize()
         self._bus.write_byte_data(self._address, self.CTRL_MEAS, self._ctrl_meas | 0x01)
         time.sleep(0.01)
         data = self._bus.read_i2c_block_data(self._address, self.DATA_START, 6)
@@ -111,13 +136,24 @@ class AHT20:
     def __init__(self, bus, address: int) -> None:
         self._bus = bus
         self._address = address
+        self._initialized = False
+
+    def bind(self, bus) -> None:
+        """Point the driver at a newly opened bus handle, keeping its one-time setup."""
+
+        self._bus = bus
+
+    def _initialize(self) -> None:
         self._bus.write_byte(self._address, 0xBA)  # soft reset
         time.sleep(0.02)
         self._bus.write_i2c_block_data(self._address, 0xBE, [0x08, 0x00])
         time.sleep(0.01)
-        logger.debug("Initialised AHT20 driver at address 0x%X", address)
+        self._initialized = True
+        logger.debug("Initialised AHT20 driver at address 0x%X", self._address)
 
     def read(self) -> Tuple[float, float]:
+        if not self._initialized:
+            self._initialize()
         self._bus.write_i2c_block_data(self._address, 0xAC, [0x33, 0x00])
         time.sleep(0.08)
         for _ in range(5):
@@ -134,9 +170,65 @@ class AHT20:
         raise RuntimeError("AHT20 sensor timeout waiting for data readiness.")
 
 
-def read_environment(bus_id: int, aht20_address: int, bmp280_address: int) -> EnvironmentSnapshot:
-    """Read the temperature, humidity and pressure sensors."""
+def _read_cached(driver_cls, bus, bus_id: int, address: int) -> Tuple[float, float]:
+    """Read through a cached driver, re-initialising it next time if the read fails."""
+
+    key = (bus_id, driver_cls.__name__, address)
+    driver = _DRIVERS.get(key)
+    if driver is None:
+        driver = _DRIVERS[key] = driver_cls(bus, address)
+    # The bus handle is opened per call; point the long-lived driver at the current one.
+    driver.bind(bus)
+    try:
+        return driver.read()
+    except Exception:
+        _DRIVERS.pop(key, None)
+        raise
+
+
+def _fresh_snapshot(key: Tuple[int, int, int], max_age_s: float) -> Optional[EnvironmentSnapshot]:
+    cached = _SNAPSHOTS.get(key)
+    if cached is not None and time.monotonic() - cached[0] < max_age_s:
+        return cached[1].copy()
+    return None
+
+
+def read_environment(
+    bus_id: int,
+    aht20_address: int,
+    bmp280_address: int,
+    *,
+    max_age_s: float = ENVIRONMENT_MAX_AGE_SECONDS,
+    force: bool = False,
+) -> EnvironmentSnapshot:
+    """Read the temperature, humidity and pressure sensors.
+
+    A copy of a snapshot taken less than ``max_age_s`` seconds ago is returned, so several callers
+    in the same polling step share one I2C round trip; pass ``force=True`` to always hit the sensors.
+    Snapshots with sensor errors are never reused.
+    """
+
+    key = (bus_id, aht20_address, bmp280_address)
+    if not force:
+        cached = _fresh_snapshot(key, max_age_s)
+        if cached is not None:
+            return cached
+    with _SENSOR_LOCK:
+        if not force:
+            # Another caller may have refreshed the snapshot while this one waited for the lock.
+            cached = _fresh_snapshot(key, max_age_s)
+            if cached is not None:
+                return cached
+        taken_at = time.monotonic()
+        snapshot = _read_sensors(bus_id, aht20_address, bmp280_address)
+        if snapshot.errors:
+            _SNAPSHOTS.pop(key, None)
+            return snapshot
+        _SNAPSHOTS[key] = (taken_at, snapshot)
+        return snapshot.copy()
+
 
+def _read_sensors(bus_id: int, aht20_address: int, bmp280_address: int) -> EnvironmentSnapshot:
     snapshot = EnvironmentSnapshot()
     logger.debug(
         "Reading environment sensors on bus %s (AHT20=0x%X BMP280=0x%X)",
@@ -147,8 +239,7 @@ def read_environment(bus_id: int, aht20_address: int, bmp280_address: int) -> En
     try:
         with open_bus(bus_id) as bus:
             try:
-                aht20 = AHT20(bus, aht20_address)
-                temp_c, humidity = aht20.read()
+                temp_c, humidity = _read_cached(AHT20, bus, bus_id, aht20_address)
                 snapshot.results["aht20"] = {
                     "temperature_c": round(temp_c, 2),
                     "humidity_pct": round(humidity, 2),
@@ -157,8 +248,7 @@ def read_environment(bus_id: int, aht20_address: int, bmp280_address: int) -> En
                 snapshot.errors["aht20"] = str(exc)
                 logger.warning("AHT20 read failed: %s", exc)
             try:
-                bmp280 = BMP280(bus, bmp280_address)
-                temp_c, pressure_hpa = bmp280.read()
+                temp_c, pressure_hpa = _read_cached(BMP280, bus, bus_id, bmp280_address)
                 snapshot.results["bmp280"] = {
                     "temperature_c": round(temp_c, 2),
                     "pressure_hpa": round(pressure_hpa, 2),
@@ -13,6 +13,7 @@ from ..logger import get_logger
 from .base import HardwareStatus, HardwareTest, HardwareTestResult
 from .camera import CameraUnavailable, capture_jpeg_frame
 from .i2c import SMBusNotAvailable, has_smbus, open_bus
+from .picamera import release_picamera
 from .pir import PIRUnavailable, read_pir_states
 from .power import read_ups
 from .rgb_led import RGBLedUnavailable, flash_rgb_led_sequence
@@ -74,6 +75,7 @@ class I2CBusTest(HardwareTest):
     name = "I2C Bus"
     description = "Verify that the primary I2C bus opens successfully."
     category = "sensors"
+    resource = "i2c"
 
     def run(self) -> HardwareTestResult:
         settings = get_settings()
@@ -125,6 +127,7 @@ class SeengreatUPSTest(HardwareTest):
     name = "Seengreat UPS Module"
     description = "Read bus voltage and current from the Seengreat Pi Zero UPS HAT (B)."
     category = "power"
+    resource = "i2c"
 
     def run(self) -> HardwareTestResult:
         settings = get_settings()
@@ -193,6 +196,7 @@ class EnvironmentalSensorTest(HardwareTest):
     name = "AHT20 + BMP280 Environmental Sensors"
     description = "Read temperature, humidity, and pressure from the combo module."
     category = "sensors"
+    resource = "i2c"
 
     def run(self) -> HardwareTestResult:
         settings = get_settings()
@@ -213,6 +217,7 @@ class EnvironmentalSensorTest(HardwareTest):
                 settings.i2c_bus_id,
                 settings.aht20_i2c_address,
                 settings.bmp280_i2c_address,
+                force=True,
             )
         except SMBusNotAvailable:
             logger.warning("SMBus not available during environmental diagnostic run")
@@ -263,6 +268,7 @@ class PicameraTest(HardwareTest):
     name = "Pi Camera Module"
     description = "Initialise the CSI camera via Picamera2."
     category = "imaging"
+    resource = "csi-camera"
 
     def run(self) -> HardwareTestResult:
         logger.debug("Running Picamera diagnostic")
@@ -272,6 +278,8 @@ class PicameraTest(HardwareTest):
             logger.warning("Picamera2 not installed; skipping Picamera diagnostic")
             return _skipped_result(self, PICAMERA_SKIP_MESSAGE)
         try:
+            # Picamera2 allows a single instance per sensor; free the one kept warm for snapshots.
+            release_picamera()
             camera = Picamera2()
             camera.close()
         except Exception as exc:
@@ -297,6 +305,7 @@ class UsbCameraTest(HardwareTest):
     name = "USB Camera"
     description = "Capture a JPEG frame from the USB camera."
     category = "imaging"
+    resource = "usb-camera"
 
     def run(self) -> HardwareTestResult:
         settings = get_settings()
@@ -330,6 +339,7 @@ class PIRSensorTest(HardwareTest):
     name = "PIR Motion Sensors"
     description = "Read the digital state of configured PIR motion sensors."
     category = "sensors"
+    resource = "gpio"
 
     def run(self) -> HardwareTestResult:
         logger.debug("Running PIR sensor diagnostic")
@@ -365,6 +375,7 @@ class RGBLedTest(HardwareTest):
     name = "RGB LED"
     description = "Flash the RGB LED channels sequentially."
     category = "actuators"
+    resource = "gpio"
 
     def run(self) -> HardwareTestResult:
         logger.debug("Running RGB LED diagnostic")
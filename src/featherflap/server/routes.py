@@ -1914,16 +1914,19 @@ def _storage_snapshot(recordings_path: Path) -> Dict[str, Optional[float]]:
     }
 
 
+_THERMAL_SENSOR_PATHS = (
+    "/sys/class/thermal/thermal_zone0/temp",
+    "/sys/class/hwmon/hwmon0/temp1_input",
+)
+
+
 def _read_temperature_sensor() -> Optional[float]:
     """Read SoC temperature (°C) from standard thermal zone paths."""
 
-    candidates = (
-        Path("/sys/class/thermal/thermal_zone0/temp"),
-        Path("/sys/class/hwmon/hwmon0/temp1_input"),
-    )
-    for candidate in candidates:
+    for candidate in _THERMAL_SENSOR_PATHS:
         try:
-            raw = candidate.read_text(encoding="utf-8").strip()
+            with open(candidate, "r", encoding="utf-8") as handle:
+                raw = handle.read().strip()
         except OSError:
             continue
         if not raw:
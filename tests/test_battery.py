@@ -0,0 +1,76 @@
+import threading
+
+from featherflap.hardware import battery
+from featherflap.hardware.battery import BatteryEstimator
+
+
+def _record(estimator: BatteryEstimator, timestamp: float) -> None:
+    estimator.record_sample(
+        timestamp=timestamp,
+        voltage_v=3.9,
+        current_ma=-120.0,
+        flow="discharging",
+        nominal_capacity_mah=1000.0,
+    )
+
+
+def _history_lines(estimator: BatteryEstimator) -> list:
+    if not estimator.history_path.exists():
+        return []
+    return estimator.history_path.read_bytes().splitlines()
+
+
+def test_history_written_on_close(tmp_path) -> None:
+    estimator = BatteryEstimator(data_dir=tmp_path)
+    _record(estimator, 1.0)
+    _record(estimator, 2.0)
+    assert _history_lines(estimator) == []
+    # State is never batched, so it is already on disk before close().
+    assert battery._loads(estimator.state_path.read_bytes())["samples_recorded"] == estimator.state.samples_recorded
+
+    estimator.close()
+
+    assert len(_history_lines(estimator)) == 2
+
+
+def test_history_written_after_flush_interval(tmp_path, monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(battery.time, "monotonic", lambda: now[0])
+    estimator = BatteryEstimator(data_dir=tmp_path)
+    _record(estimator, 1.0)
+    assert _history_lines(estimator) == []
+
+    now[0] += battery.HISTORY_FLUSH_SECONDS
+    _record(estimator, 2.0)
+
+    assert len(_history_lines(estimator)) == 2
+    assert estimator.state_path.exists()
+    estimator.close()
+
+
+def test_history_appends_from_several_threads_are_not_lost(tmp_path) -> None:
+    estimator = BatteryEstimator(data_dir=tmp_path)
+
+    def append_samples() -> None:
+        for index in range(200):
+            estimator._append_history({"timestamp": float(index)})
+
+    workers = [threading.Thread(target=append_samples) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    estimator.close()
+
+    assert len(_history_lines(estimator)) == 800
+
+
+def test_state_file_recreated_after_removal(tmp_path) -> None:
+    estimator = BatteryEstimator(data_dir=tmp_path)
+    _record(estimator, 1.0)
+    estimator.state_path.unlink()
+
+    _record(estimator, 2.0)
+
+    assert battery._loads(estimator.state_path.read_bytes())["samples_recorded"] == estimator.state.samples_recorded
+    estimator.close()
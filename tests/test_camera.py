@@ -0,0 +1,90 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from featherflap.hardware import camera
+
+
+class FakeVideoWriter:
+    def __init__(self, target: str, *args, hardware_ok: bool = False) -> None:
+        self.target = target
+        self.args = args
+        self.released = False
+        self._opened = hardware_ok or not target.startswith("appsrc")
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def release(self) -> None:
+        self.released = True
+
+
+def _fake_cv2(created: list, hardware_ok: bool = False) -> SimpleNamespace:
+    def video_writer(target, *args):
+        writer = FakeVideoWriter(target, *args, hardware_ok=hardware_ok)
+        created.append(writer)
+        return writer
+
+    return SimpleNamespace(
+        CAP_GSTREAMER=1800,
+        VideoWriter=video_writer,
+        VideoWriter_fourcc=lambda *chars: "".join(chars),
+    )
+
+
+def test_video_writer_falls_back_to_mp4v_when_pipeline_fails(tmp_path: Path) -> None:
+    created: list = []
+    output = tmp_path / "clip.mp4"
+
+    writer = camera._open_video_writer(_fake_cv2(created), output, 10.0, (640, 480))
+
+    assert [w.target.startswith("appsrc") for w in created] == [True, False]
+    assert created[0].released
+    assert writer is created[1]
+    assert writer.target == str(output)
+    assert writer.args[0] == "mp4v"
+
+
+def test_video_writer_skips_pipeline_for_unsafe_paths(tmp_path: Path) -> None:
+    created: list = []
+    output = tmp_path / 'clip" ! fakesink.mp4'
+
+    writer = camera._open_video_writer(_fake_cv2(created, hardware_ok=True), output, 10.0, (640, 480))
+
+    assert created == [writer]
+    assert writer.target == str(output)
+
+
+class CountingCapture:
+    def __init__(self) -> None:
+        self.grabs = 0
+        self.released = False
+
+    def set(self, prop, value) -> bool:
+        return True
+
+    def grab(self) -> bool:
+        self.grabs += 1
+        return True
+
+    def retrieve(self):
+        return True, object()
+
+    def release(self) -> None:
+        self.released = True
+
+
+def test_pooled_snapshot_skips_warmup_frames(monkeypatch) -> None:
+    capture = CountingCapture()
+    monkeypatch.setattr(camera, "_ensure_cv2", lambda: SimpleNamespace(CAP_PROP_BUFFERSIZE=38))
+    monkeypatch.setattr(camera, "_create_capture", lambda *key: capture)
+    monkeypatch.setattr(camera, "_encode_jpeg", lambda frame, quality: b"\xff\xd8jpeg")
+    camera.release_capture_pool()
+    try:
+        camera.capture_jpeg_frame(warmup_frames=2)
+        assert capture.grabs == 3
+
+        camera.capture_jpeg_frame(warmup_frames=2)
+        assert capture.grabs == 5
+    finally:
+        camera.release_capture_pool()
+    assert capture.released
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("pydantic")
+
+from featherflap import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(config, "RUNTIME_CONFIG_PATH", tmp_path / "settings.json")
+    monkeypatch.setattr(config, "_OVERRIDES_CACHE", None)
+    monkeypatch.setattr(config, "_SETTINGS", None)
+    yield
+    config._SETTINGS = None
+
+
+def test_reload_picks_up_environment_changes(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FEATHERFLAP_PIR_PINS", "17")
+    assert config.reload_settings().pir_pins == [17]
+
+    monkeypatch.setenv("FEATHERFLAP_PIR_PINS", "27")
+    assert config.reload_settings().pir_pins == [27]
+
+
+def test_reload_returns_fresh_settings_objects() -> None:
+    first = config.reload_settings()
+    second = config.reload_settings()
+
+    assert first is not second
+    assert first.pir_pins is not second.pir_pins
+
+
+def test_runtime_overrides_cache_returns_copies_and_tracks_edits() -> None:
+    path = config.RUNTIME_CONFIG_PATH
+    path.write_text('{"pir_pins": [17]}')
+
+    loaded = config._load_runtime_overrides()
+    loaded["pir_pins"].append(27)
+    assert config._load_runtime_overrides() == {"pir_pins": [17]}
+
+    path.write_text('{"pir_pins": [17, 22]}')
+    assert config._load_runtime_overrides() == {"pir_pins": [17, 22]}
+
+
+def test_update_settings_does_not_share_sleep_windows() -> None:
+    windows = [{"start": "22:00", "end": "06:00"}]
+    old = config.update_settings({"sleep_windows": windows})
+    assert old.sleep_windows is not windows
+    assert old.sleep_windows[0] is not windows[0]
+
+    new = config.update_settings({"pir_pins": [17]})
+
+    assert new.sleep_windows == old.sleep_windows
+    assert new.sleep_windows is not old.sleep_windows
+    assert new.sleep_windows[0] is not old.sleep_windows[0]
@@ -0,0 +1,120 @@
+import enum
+import sys
+import types
+from contextlib import contextmanager
+
+import pytest
+
+from featherflap.hardware import pir
+
+
+class Bias(enum.Enum):
+    PULL_DOWN = "pull-down"
+    PULL_UP = "pull-up"
+    DISABLED = "disabled"
+
+
+class Direction(enum.Enum):
+    INPUT = "input"
+
+
+class Value(enum.Enum):
+    INACTIVE = 0
+    ACTIVE = 1
+
+
+def _stub_gpiod(requests: list, labels: dict, fail: bool = False) -> types.ModuleType:
+    gpiod = types.ModuleType("gpiod")
+    line = types.ModuleType("gpiod.line")
+    line.Bias, line.Direction, line.Value = Bias, Direction, Value
+    gpiod.line = line
+
+    class Chip:
+        def __init__(self, path: str) -> None:
+            self.path = path
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            return None
+
+        def get_info(self):
+            return types.SimpleNamespace(label=labels[self.path])
+
+    class Request:
+        def get_values(self, pins):
+            return [Value.ACTIVE if pin == 17 else Value.INACTIVE for pin in pins]
+
+    @contextmanager
+    def request_lines(path, consumer, config):
+        if fail:
+            raise OSError("line busy")
+        requests.append((path, config))
+        yield Request()
+
+    gpiod.Chip = Chip
+    gpiod.LineSettings = lambda **kwargs: kwargs
+    gpiod.is_gpiochip_device = lambda path: path in labels
+    gpiod.request_lines = request_lines
+    return gpiod
+
+
+def _stub_rpi_gpio(setups: list) -> types.ModuleType:
+    gpio = types.ModuleType("RPi.GPIO")
+    gpio.BCM, gpio.IN = "BCM", "IN"
+    gpio.PUD_DOWN, gpio.PUD_UP, gpio.PUD_OFF = "PUD_DOWN", "PUD_UP", "PUD_OFF"
+    gpio.setwarnings = gpio.setmode = gpio.cleanup = lambda *args: None
+    gpio.setup = lambda pin, mode, pull_up_down: setups.append((pin, pull_up_down))
+    gpio.input = lambda pin: 1 if pin == 17 else 0
+    rpi = types.ModuleType("RPi")
+    rpi.GPIO = gpio
+    return rpi
+
+
+@pytest.fixture
+def gpio_modules(monkeypatch: pytest.MonkeyPatch):
+    pir._bcm_gpio_chip.cache_clear()
+    labels = {"/dev/gpiochip0": "pinctrl-rp1-aux", "/dev/gpiochip4": "pinctrl-rp1"}
+    monkeypatch.setattr(pir.glob, "glob", lambda pattern: sorted(labels))
+    setups: list = []
+    rpi = _stub_rpi_gpio(setups)
+    monkeypatch.setitem(sys.modules, "RPi", rpi)
+    monkeypatch.setitem(sys.modules, "RPi.GPIO", rpi.GPIO)
+
+    def install_gpiod(**kwargs) -> list:
+        requests: list = []
+        gpiod = _stub_gpiod(requests, labels, **kwargs)
+        monkeypatch.setitem(sys.modules, "gpiod", gpiod)
+        monkeypatch.setitem(sys.modules, "gpiod.line", gpiod.line)
+        return requests
+
+    yield install_gpiod, setups, monkeypatch
+    pir._bcm_gpio_chip.cache_clear()
+
+
+def test_gpiod_reads_bcm_controller_with_configured_pull(gpio_modules) -> None:
+    install_gpiod, setups, _ = gpio_modules
+    requests = install_gpiod()
+
+    states = pir.read_pir_states([17, 27], pull="up")
+
+    assert states == {17: 1, 27: 0}
+    assert setups == []
+    assert requests == [("/dev/gpiochip4", {(17, 27): {"direction": Direction.INPUT, "bias": Bias.PULL_UP}})]
+
+
+def test_falls_back_to_rpi_gpio_when_gpiod_request_fails(gpio_modules) -> None:
+    install_gpiod, setups, _ = gpio_modules
+    install_gpiod(fail=True)
+
+    assert pir.read_pir_states([17, 27]) == {17: 1, 27: 0}
+    assert setups == [(17, "PUD_DOWN"), (27, "PUD_DOWN")]
+
+
+def test_falls_back_to_rpi_gpio_without_gpiod(gpio_modules) -> None:
+    _, setups, monkeypatch = gpio_modules
+    monkeypatch.setitem(sys.modules, "gpiod", None)
+
+    assert pir.read_pir_states([17], pull="up") == {17: 1}
+    assert setups == [(17, "PUD_UP")]
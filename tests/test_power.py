@@ -0,0 +1,97 @@
+import pytest
+
+from featherflap.hardware import i2c, power
+
+SHUNT_RAW = -1234  # 0xFB2E: -12.34 mV across the shunt, i.e. current flowing out of the battery.
+BUS_RAW = (975 << 3) | 0b010  # 3.900 V with the conversion-ready flag set.
+
+
+class FakeMessage:
+    def __init__(self, kind: str, address: int, data: list) -> None:
+        self.kind = kind
+        self.address = address
+        self.data = data
+
+    @classmethod
+    def read(cls, address: int, length: int) -> "FakeMessage":
+        return cls("read", address, [0] * length)
+
+    @classmethod
+    def write(cls, address: int, data: list) -> "FakeMessage":
+        return cls("write", address, list(data))
+
+    def __iter__(self):
+        return iter(self.data)
+
+
+class FakeINA219Bus:
+    """INA219 register file that does not auto-increment its register pointer."""
+
+    def __init__(self, registers: dict) -> None:
+        self.registers = {register: value & 0xFFFF for register, value in registers.items()}
+        self.transfers = 0
+
+    def _bytes(self, register: int, length: int) -> list:
+        return list(self.registers[register].to_bytes(2, "big")[:length])
+
+    def read_i2c_block_data(self, address: int, register: int, length: int) -> list:
+        return self._bytes(register, length)
+
+    def read_word_data(self, address: int, register: int) -> int:
+        # SMBus words arrive least-significant byte first, so big-endian registers come back swapped.
+        msb, lsb = self._bytes(register, 2)
+        return (lsb << 8) | msb
+
+
+class FakeRdwrBus(FakeINA219Bus):
+    def i2c_rdwr(self, *messages: FakeMessage) -> None:
+        self.transfers += 1
+        pointer = None
+        for message in messages:
+            if message.kind == "write":
+                pointer = message.data[0]
+            else:
+                message.data[:] = self._bytes(pointer, len(message.data))
+
+
+class PlainBus(FakeINA219Bus):
+    pass
+
+
+def _baseline_word(bus: FakeINA219Bus, register: int, signed: bool = False) -> int:
+    raw = bus.read_word_data(0x40, register)
+    value = ((raw & 0xFF) << 8) | ((raw >> 8) & 0xFF)
+    if signed and value & 0x8000:
+        value -= 0x10000
+    return value
+
+
+@pytest.fixture
+def fake_i2c_msg(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(i2c, "i2c_msg", FakeMessage)
+
+
+@pytest.mark.parametrize("bus_cls", [FakeRdwrBus, PlainBus])
+def test_read_registers_returns_each_register(fake_i2c_msg, bus_cls) -> None:
+    bus = bus_cls({0x01: 0x1234, 0x02: 0xABCD})
+
+    values = i2c.read_registers(bus, 0x40, (0x02, 0x01))
+
+    assert values == [b"\xab\xcd", b"\x12\x34"]
+    assert bus.transfers == (1 if bus_cls is FakeRdwrBus else 0)
+
+
+@pytest.mark.parametrize("bus_cls", [FakeRdwrBus, PlainBus])
+@pytest.mark.parametrize("shunt_raw", [SHUNT_RAW, 1234])
+def test_ina219_decode_matches_word_reads(fake_i2c_msg, bus_cls, shunt_raw: int) -> None:
+    bus = bus_cls({power.INA219_REG_SHUNT_VOLTAGE: shunt_raw, power.INA219_REG_BUS_VOLTAGE: BUS_RAW})
+
+    readings = power._read_ina219(bus, 0x40, 0.01)
+
+    shunt_v = _baseline_word(bus, power.INA219_REG_SHUNT_VOLTAGE, signed=True) * power.INA219_SHUNT_VOLTAGE_LSB
+    bus_v = ((_baseline_word(bus, power.INA219_REG_BUS_VOLTAGE) >> 3) & 0x1FFF) * power.INA219_BUS_VOLTAGE_LSB
+    assert readings.shunt_voltage_mv == pytest.approx(shunt_v * 1000.0)
+    assert readings.current_ma == pytest.approx(shunt_v / 0.01 * 1000.0)
+    assert readings.bus_voltage_v == pytest.approx(bus_v)
+    assert readings.bus_voltage_v == pytest.approx(3.9)
+    assert (readings.current_ma < 0) == (shunt_raw < 0)
@@ -0,0 +1,52 @@
+import threading
+import time
+
+from featherflap.hardware.base import HardwareStatus, HardwareTest, HardwareTestResult
+from featherflap.hardware.registry import HardwareTestRegistry
+
+
+class RecordingTest(HardwareTest):
+    def __init__(self, test_id: str, resource: str | None, active: dict, lock: threading.Lock) -> None:
+        self.id = test_id
+        self.name = test_id
+        self.resource = resource
+        self._active = active
+        self._lock = lock
+
+    def run(self) -> HardwareTestResult:
+        with self._lock:
+            key = self.resource or self.id
+            self._active[key] = self._active.get(key, 0) + 1
+            self._active["max_" + key] = max(self._active.get("max_" + key, 0), self._active[key])
+        time.sleep(0.05)
+        with self._lock:
+            self._active[self.resource or self.id] -= 1
+        return HardwareTestResult(id=self.id, name=self.name, status=HardwareStatus.OK, summary="ok")
+
+
+def test_run_all_keeps_order_and_serialises_shared_resources() -> None:
+    active: dict = {}
+    lock = threading.Lock()
+    registry = HardwareTestRegistry()
+    registry.register(
+        RecordingTest("a", "i2c", active, lock),
+        RecordingTest("b", None, active, lock),
+        RecordingTest("c", "i2c", active, lock),
+        RecordingTest("d", "gpio", active, lock),
+    )
+
+    results = registry.run_all()
+
+    assert [result.id for result in results] == ["a", "b", "c", "d"]
+    assert active["max_i2c"] == 1
+
+
+def test_run_all_sequential_when_disabled() -> None:
+    active: dict = {}
+    lock = threading.Lock()
+    registry = HardwareTestRegistry()
+    registry.register(RecordingTest("a", None, active, lock), RecordingTest("b", None, active, lock))
+
+    results = registry.run_all(parallel=False)
+
+    assert [result.id for result in results] == ["a", "b"]
@@ -0,0 +1,94 @@
+import pytest
+
+from featherflap.hardware import sensors
+from featherflap.hardware.sensors import EnvironmentSnapshot
+
+
+@pytest.fixture(autouse=True)
+def empty_sensor_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sensors, "_SNAPSHOTS", {})
+    monkeypatch.setattr(sensors, "_DRIVERS", {})
+
+
+@pytest.fixture
+def sensor_reads(monkeypatch: pytest.MonkeyPatch) -> list:
+    calls: list = []
+
+    def fake_read_sensors(bus_id: int, aht20_address: int, bmp280_address: int) -> EnvironmentSnapshot:
+        calls.append(bus_id)
+        return EnvironmentSnapshot(results={"aht20": {"temperature_c": 21.0, "humidity_pct": 40.0}})
+
+    monkeypatch.setattr(sensors, "_read_sensors", fake_read_sensors)
+    return calls
+
+
+def test_read_environment_reuses_fresh_snapshot(sensor_reads: list) -> None:
+    first = sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0)
+    first.results["aht20"]["temperature_c"] = -1.0
+    second = sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0)
+
+    assert sensor_reads == [1]
+    assert second is not first
+    assert second.results["aht20"]["temperature_c"] == 21.0
+
+
+def test_read_environment_rereads_expired_snapshot(sensor_reads: list) -> None:
+    sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0)
+    sensors.read_environment(1, 0x38, 0x77, max_age_s=0.0)
+
+    assert sensor_reads == [1, 1]
+
+
+def test_read_environment_force_bypasses_snapshot(sensor_reads: list) -> None:
+    sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0)
+    sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0, force=True)
+
+    assert sensor_reads == [1, 1]
+
+
+def test_read_environment_does_not_reuse_failed_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list = []
+
+    def failing_read_sensors(bus_id: int, aht20_address: int, bmp280_address: int) -> EnvironmentSnapshot:
+        calls.append(bus_id)
+        return EnvironmentSnapshot(errors={"bmp280": "no ack"})
+
+    monkeypatch.setattr(sensors, "_read_sensors", failing_read_sensors)
+    sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0)
+    sensors.read_environment(1, 0x38, 0x77, max_age_s=60.0)
+
+    assert calls == [1, 1]
+
+
+class FakeAHT20Bus:
+    def __init__(self) -> None:
+        self.resets = 0
+        self.fail_next_read = False
+
+    def write_byte(self, address: int, value: int) -> None:
+        if value == 0xBA:
+            self.resets += 1
+
+    def write_i2c_block_data(self, address: int, register: int, data: list) -> None:
+        pass
+
+    def read_i2c_block_data(self, address: int, register: int, length: int) -> list:
+        if self.fail_next_read:
+            self.fail_next_read = False
+            raise OSError("no ack")
+        return [0x1C, 0x66, 0x66, 0x65, 0x99, 0x9A]
+
+
+def test_cached_driver_initialises_once_until_a_read_fails() -> None:
+    bus = FakeAHT20Bus()
+    sensors._read_cached(sensors.AHT20, bus, 1, 0x38)
+    reopened = FakeAHT20Bus()
+    sensors._read_cached(sensors.AHT20, reopened, 1, 0x38)
+    assert (bus.resets, reopened.resets) == (1, 0)
+
+    bus.fail_next_read = True
+    with pytest.raises(OSError):
+        sensors._read_cached(sensors.AHT20, bus, 1, 0x38)
+    sensors._read_cached(sensors.AHT20, bus, 1, 0x38)
+
+    assert bus.resets == 2